@@ -258,8 +258,12 @@ if (args.length > 0) {
   console.warn("meshbridge: CLI flags are not supported yet (WIP UI only).");
 }
 
+// Hand the UI our version so it doesn't have to read package.json itself.
+const { version } = require(path.resolve(__dirname, "..", "package.json"));
+
 const result = spawnSync(python.cmd, [...python.args, scriptPath], {
   stdio: "inherit",
+  env: { ...process.env, MESHTASTIC_BRIDGE_VERSION: version || "" },
 });
 
 if (result.error) {
@@ -2,7 +2,7 @@
 
 Optimizations:
 - Binary chunk header (fixed 16 bytes)
-- MessagePack payloads + Zstandard compression
+- MessagePack payloads + Zstandard compression (skipped when it would not shrink them)
 - Short message ID prefixes in chunks
 """
 
@@ -22,6 +22,7 @@ __all__ = [
     "MessageEnvelope",
     "chunk_envelope",
     "parse_chunk",
+    "parse_chunk_header",
     "reconstruct_message",
     "build_ack_chunk",
     "build_nack_chunk",
@@ -33,14 +34,20 @@ __all__ = [
     "VERSION",
     "FLAG_ACK",
     "FLAG_NACK",
+    "FLAG_UNCOMPRESSED",
     "HEADER_SIZE",
     "SEGMENT_SIZE",
 ]
 
 MAGIC = b"MB"
-VERSION = 1
+# Version 2 added FLAG_UNCOMPRESSED. Version 1 nodes always decompress, so they must
+# reject our frames outright; we still accept theirs, which are always compressed.
+VERSION = 2
+_LEGACY_VERSION = 1
 FLAG_ACK = 0x01
 FLAG_NACK = 0x02
+# Set on every chunk of a message whose payload is plain MessagePack.
+FLAG_UNCOMPRESSED = 0x04
 HEADER_STRUCT = struct.Struct("!2sBB8sHH")
 HEADER_SIZE = HEADER_STRUCT.size
 
@@ -60,6 +67,7 @@ _COMPRESSOR_THOROUGH = zstd.ZstdCompressor(level=5)  # For payloads > 1000 bytes
 _DECOMPRESSOR = zstd.ZstdDecompressor()
 
 # Thresholds for adaptive compression
+_COMPRESSION_THRESHOLD_MIN = 128  # bytes; smaller payloads are sent as plain MessagePack
 _COMPRESSION_THRESHOLD_FAST = 200  # bytes
 _COMPRESSION_THRESHOLD_THOROUGH = 1000  # bytes
 ALIAS_MAP: Dict[str, str] = {}
@@ -164,8 +172,11 @@ def _select_compressor(payload_size: int) -> zstd.ZstdCompressor:
     return _COMPRESSOR_DEFAULT
 
 
-def _encode_payload(envelope: MessageEnvelope) -> bytes:
-    """Encode envelope as compressed binary payload with scoped aliasing."""
+def _encode_payload(envelope: MessageEnvelope) -> Tuple[bytes, bool]:
+    """Encode envelope as binary payload with scoped aliasing.
+
+    Returns the payload and whether it is zstd-compressed.
+    """
     # 1. Start with raw dict
     raw = envelope.to_dict()
     
@@ -179,15 +190,23 @@ def _encode_payload(envelope: MessageEnvelope) -> bytes:
         aliased[ENVELOPE_ALIAS_MAP.get(k, k)] = v
         
     payload = msgpack.packb(aliased, use_bin_type=True)
+    # Frame overhead (~9 bytes) outweighs any savings on small envelopes such as
+    # health checks and short responses; every byte is airtime.
+    if len(payload) < _COMPRESSION_THRESHOLD_MIN:
+        return payload, False
     # Use adaptive compression based on payload size
     compressor = _select_compressor(len(payload))
-    return compressor.compress(payload)
+    compressed = compressor.compress(payload)
+    if len(compressed) < len(payload):
+        return compressed, True
+    return payload, False
 
 
-def _decode_payload(encoded: bytes) -> Dict[str, Any]:
-    """Decode compressed binary payload back to dict with scoped aliasing."""
-    decompressed = _DECOMPRESSOR.decompress(encoded)
-    unpacked = msgpack.unpackb(decompressed, raw=False)
+def _decode_payload(encoded: bytes, compressed: bool = True) -> Dict[str, Any]:
+    """Decode binary payload back to dict with scoped aliasing."""
+    if compressed:
+        encoded = _DECOMPRESSOR.decompress(encoded)
+    unpacked = msgpack.unpackb(encoded, raw=False)
     
     # 1. Un-alias top-level envelope keys
     envelope_dict = {}
@@ -203,7 +222,7 @@ def _decode_payload(encoded: bytes) -> Dict[str, Any]:
 
 def estimate_chunk_count(envelope: MessageEnvelope, segment_size: int = SEGMENT_SIZE) -> int:
     """Estimate the number of chunks without building them (faster for progress display)."""
-    encoded = _encode_payload(envelope)
+    encoded, _compressed = _encode_payload(envelope)
     if not encoded:
         return 0
     return math.ceil(len(encoded) / segment_size)
@@ -213,9 +232,10 @@ def chunk_envelope(
     envelope: MessageEnvelope, segment_size: int = SEGMENT_SIZE
 ) -> List[bytes]:
     """Split envelope into binary chunks for transmission."""
-    encoded = _encode_payload(envelope)
+    encoded, compressed = _encode_payload(envelope)
     if not encoded:
         return []
+    flags = 0 if compressed else FLAG_UNCOMPRESSED
 
     count = math.ceil(len(encoded) / segment_size)
     # Encode message ID as UTF-8 and truncate to 8 bytes
@@ -225,7 +245,7 @@ def chunk_envelope(
     chunks: List[bytes] = []
     for index in range(count):
         segment = encoded[index * segment_size : (index + 1) * segment_size]
-        header = HEADER_STRUCT.pack(MAGIC, VERSION, 0, short_id, index + 1, count)
+        header = HEADER_STRUCT.pack(MAGIC, VERSION, flags, short_id, index + 1, count)
         chunks.append(header + segment)
     return chunks
 
@@ -422,21 +442,30 @@ def parse_nack_payload(payload: bytes) -> List[int]:
     return seqs
 
 
-def parse_chunk(chunk: bytes) -> Tuple[int, str, int, int, bytes]:
+def parse_chunk_header(chunk: bytes) -> Tuple[int, str, int, int]:
+    """Parse only the fixed header, without copying the chunk payload."""
     if len(chunk) < HEADER_SIZE:
         raise ValueError("Chunk too small to parse header")
-    magic, version, flags, short_id, seq, total = HEADER_STRUCT.unpack(
-        chunk[:HEADER_SIZE]
-    )
-    if magic != MAGIC or version != VERSION:
+    magic, version, flags, short_id, seq, total = HEADER_STRUCT.unpack_from(chunk)
+    if magic != MAGIC or version not in (VERSION, _LEGACY_VERSION):
         raise ValueError("Unsupported chunk header")
     # Decode UTF-8 short ID, replacing invalid sequences with replacement character
     short_id_str = short_id.rstrip(b"\x00").decode("utf-8", errors="replace")
+    return flags, short_id_str, seq, total
+
+
+def parse_chunk(chunk: bytes) -> Tuple[int, str, int, int, bytes]:
+    flags, short_id_str, seq, total = parse_chunk_header(chunk)
     return flags, short_id_str, seq, total, chunk[HEADER_SIZE:]
 
 
-def reconstruct_message(segments: Iterable[bytes]) -> MessageEnvelope:
-    """Reconstruct message from payload segments."""
+def reconstruct_message(
+    segments: Iterable[bytes], compressed: bool = True
+) -> MessageEnvelope:
+    """Reconstruct message from payload segments.
+
+    ``compressed`` is false when the chunks carried ``FLAG_UNCOMPRESSED``.
+    """
     combined = b"".join(segments)
-    payload = _decode_payload(combined)
+    payload = _decode_payload(combined, compressed)
     return MessageEnvelope.from_dict(payload)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-import queue
 import threading
 import time
-from typing import TYPE_CHECKING, Any
+from collections import deque
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from message import parse_chunk
+from message import parse_chunk_header
 from transport import InMemoryRadio, RadioInterface
 
 if TYPE_CHECKING:
@@ -16,6 +16,72 @@ __all__ = ["SerialRadioAdapter", "build_radio"]
 
 LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Portnum arrives as the enum name or its integer value depending on the library version.
+PRIVATE_APP_PORTNUM = 80
+_PRIVATE_APP_PORTNUMS = frozenset(("PRIVATE_APP", PRIVATE_APP_PORTNUM))
+
+
+class _ReceiveRing(Generic[_T]):
+    """Single-producer/single-consumer handoff between the pubsub thread and receive().
+
+    ``deque.append``/``popleft`` are atomic under the GIL, so the only
+    synchronization needed is an Event the consumer parks on while empty.
+    """
+
+    def __init__(self) -> None:
+        self._items: deque[_T] = deque()
+        self._ready = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: _T) -> None:
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self, timeout: float) -> _T | None:
+        items = self._items
+        try:
+            return items.popleft()
+        except IndexError:
+            pass
+        # Clear before re-checking so a put() racing with us still wakes the wait.
+        self._ready.clear()
+        if not items and not self._ready.wait(timeout):
+            return None
+        try:
+            return items.popleft()
+        except IndexError:
+            return None
+
+    def get_batch(self, max_items: int, timeout: float) -> list[_T]:
+        """Wait up to ``timeout`` for one item, then drain up to ``max_items`` in order."""
+        first = self.get(timeout)
+        if first is None:
+            return []
+        batch = [first]
+        items = self._items
+        while len(batch) < max_items:
+            try:
+                batch.append(items.popleft())
+            except IndexError:
+                break
+        return batch
+
+
+def _user_id_from_node_info(node_info: Any) -> str | None:
+    """Extract the user ID from a node DB entry (dict or protobuf-like object)."""
+    if not node_info:
+        return None
+    if isinstance(node_info, dict):
+        user_info = node_info.get("user")
+        if isinstance(user_info, dict):
+            return user_info.get("id") or None
+        return None
+    return getattr(getattr(node_info, "user", None), "id", None) or None
+
 
 class SerialRadioAdapter:
     def __init__(
@@ -25,15 +91,24 @@ class SerialRadioAdapter:
         disable_dedupe: bool = False,
     ) -> None:  # type: ignore[name-defined]
         self._interface = interface
-        self._message_queue: queue.Queue[tuple[str, bytes]] = queue.Queue()
+        self._message_queue: _ReceiveRing[tuple[str, bytes]] = _ReceiveRing()
         self._subscribed = False
         self._numeric_to_user_id: dict[str, str] = {}  # Cache for numeric ID -> user ID mapping
+        self._destination_cache: dict[str, str] = {}  # Raw destination -> sendData destinationId
         self._recent_messages: dict[
             tuple[str, str, int, int, int] | tuple[str, int], float
         ] = {}  # Deduplicate recent messages (sender, chunk header or payload hash)
         self._dedupe_ttl_seconds = 8.0
         self._message_lock = threading.Lock()  # Thread-safe access to recent_messages
         self._disable_dedupe = disable_dedupe
+        # Resolve the PRIVATE_APP port once; sendData is called for every chunk.
+        # No lock is taken around sendData: the interface serializes writes itself.
+        try:
+            from meshtastic import portnums_pb2
+
+            self._portnum: int = portnums_pb2.PRIVATE_APP
+        except ImportError:
+            self._portnum = PRIVATE_APP_PORTNUM
         # Periodic cleanup state (avoid O(n) scan on every message)
         self._dedupe_cleanup_counter: int = 0
         self._dedupe_cleanup_every_n: int = 25  # Cleanup every 25 messages
@@ -104,14 +179,10 @@ class SerialRadioAdapter:
                     )
                 return
 
+            # Only handle PRIVATE_APP messages (our chunks); reject everything else
+            # with a single lookup since most mesh traffic is not ours.
             decoded = packet.get("decoded")
-            if not decoded:
-                return
-
-            # Only handle PRIVATE_APP messages (our chunks)
-            # Portnum can be string "PRIVATE_APP" or integer 80
-            portnum = decoded.get("portnum")
-            if portnum not in ("PRIVATE_APP", 80):
+            if not decoded or decoded.get("portnum") not in _PRIVATE_APP_PORTNUMS:
                 return
 
             # Get source node ID - prefer fromId (user ID format) over from (numeric)
@@ -130,48 +201,9 @@ class SerialRadioAdapter:
             numeric_id = packet.get("from")
 
             if not source and numeric_id:
-                # fromId is None - node not yet in database (normal for first packet)
-                # Use _getOrCreateByNum to create placeholder entry and derive user ID
-                try:
-                    numeric_id_int = int(numeric_id)
-
-                    # Use _getOrCreateByNum to ensure node entry exists (creates placeholder with derived user ID)
-                    if hasattr(self._interface, "_getOrCreateByNum"):
-                        node_info = self._interface._getOrCreateByNum(numeric_id_int)
-                        if node_info:
-                            # Extract user ID from the node info
-                            if isinstance(node_info, dict):
-                                user_info = node_info.get("user")
-                                if user_info and isinstance(user_info, dict):
-                                    source = user_info.get("id")
-                            elif hasattr(node_info, "user"):
-                                user_obj = node_info.user
-                                if hasattr(user_obj, "id"):
-                                    source = user_obj.id
-
-                            if source:
-                                LOGGER.debug(
-                                    "Derived user ID %s from numeric ID %s via _getOrCreateByNum",
-                                    source,
-                                    numeric_id,
-                                )
-                                self._numeric_to_user_id[str(numeric_id)] = source
-
-                    # Fallback: derive user ID directly from numeric ID (hex format)
-                    if not source:
-                        # Format numeric ID as 8-digit hex and prepend "!" (default Meshtastic format)
-                        source = f"!{numeric_id_int:08x}"
-                        LOGGER.debug(
-                            "Derived user ID %s from numeric ID %s (presumptive format)",
-                            source,
-                            numeric_id,
-                        )
-                        self._numeric_to_user_id[str(numeric_id)] = source
-
-                except Exception as e:
-                    LOGGER.debug("Could not derive user ID from numeric ID %s: %s", numeric_id, e)
-                    # Last resort: use numeric ID as-is
-                    source = numeric_id
+                # fromId is None - node not yet in database (normal for first packet).
+                # Resolution is cached per numeric ID, so only the first packet pays for it.
+                source = self._convert_numeric_to_user_id(str(numeric_id)) or numeric_id
             elif source and numeric_id:
                 # Both available - cache the mapping
                 self._numeric_to_user_id[str(numeric_id)] = str(source)
@@ -186,12 +218,15 @@ class SerialRadioAdapter:
                 return
 
             if not isinstance(payload_bytes, bytes):
-                payload_bytes = str(payload_bytes).encode("utf-8")
+                if isinstance(payload_bytes, (bytearray, memoryview)):
+                    payload_bytes = bytes(payload_bytes)
+                else:
+                    payload_bytes = str(payload_bytes).encode("utf-8")
 
             # Deduplicate messages using chunk header when possible (id + seq + total + flags).
             # Fall back to payload hash if parsing fails.
             try:
-                flags, short_id, seq, total, _ = parse_chunk(payload_bytes)
+                flags, short_id, seq, total = parse_chunk_header(payload_bytes)
                 message_key = (source_str, short_id, seq, total, flags)
             except Exception:
                 # Using Python's built-in hash for non-cryptographic deduplication
@@ -207,25 +242,23 @@ class SerialRadioAdapter:
                     )
                 with self._message_lock:
                     now = time.time()
-                    
+                    recent = self._recent_messages
+
                     # Periodic cleanup instead of every message (O(n) -> amortized O(1))
                     self._dedupe_cleanup_counter += 1
+                    cutoff = now - self._dedupe_ttl_seconds
                     should_cleanup = (
                         self._dedupe_cleanup_counter >= self._dedupe_cleanup_every_n
-                        or now - self._last_dedupe_cleanup >= self._dedupe_ttl_seconds
+                        or self._last_dedupe_cleanup <= cutoff
                     )
                     if should_cleanup:
-                        expired = [
-                            key
-                            for key, ts in self._recent_messages.items()
-                            if now - ts >= self._dedupe_ttl_seconds
-                        ]
+                        expired = [key for key, ts in recent.items() if ts <= cutoff]
                         for key in expired:
-                            self._recent_messages.pop(key, None)
+                            del recent[key]
                         self._dedupe_cleanup_counter = 0
                         self._last_dedupe_cleanup = now
 
-                    if message_key in self._recent_messages:
+                    if message_key in recent:
                         LOGGER.info(
                             "[RADIO] Duplicate message from %s (ignored, key=%s)",
                             source_str,
@@ -233,58 +266,29 @@ class SerialRadioAdapter:
                         )
                         return
                     # Keep last 1000 message keys for deduplication
-                    if len(self._recent_messages) > 1000:
+                    if len(recent) > 1000:
                         # Clear half of old entries (simple cleanup)
-                        keys = list(self._recent_messages.keys())[500:]
-                        self._recent_messages = {key: self._recent_messages[key] for key in keys}
-                    self._recent_messages[message_key] = now
-
-            payload_preview = payload_bytes[:32].hex()
-            LOGGER.info(
-                "[RADIO] Received PRIVATE_APP message from %s (numeric: %s): %d bytes - %s",
-                source_str,
-                packet.get("from"),
-                len(payload_bytes),
-                payload_preview,
-            )
+                        keys = list(recent)[500:]
+                        recent = {key: recent[key] for key in keys}
+                        self._recent_messages = recent
+                    recent[message_key] = now
+
+            if LOGGER.isEnabledFor(logging.INFO):
+                # The hex preview is only built when it will actually be emitted.
+                LOGGER.info(
+                    "[RADIO] Received PRIVATE_APP message from %s (numeric: %s): %d bytes - %s",
+                    source_str,
+                    numeric_id,
+                    len(payload_bytes),
+                    payload_bytes[:32].hex(),
+                )
             self._message_queue.put((source_str, payload_bytes))
         except Exception as e:
             LOGGER.debug("Error processing received message: %s", e)
 
     def send(self, destination: str, payload: bytes) -> None:  # type: ignore[override]
-        # Use sendData with PRIVATE_APP port for private messages
-        try:
-            from meshtastic import portnums_pb2
-
-            portnum = portnums_pb2.PRIVATE_APP
-        except ImportError:
-            # Fallback: PRIVATE_APP = 80
-            portnum = 80
-
-        # Convert destination to proper format
-        # Meshtastic sendData accepts both numeric IDs and user IDs - both work equivalently
-        # We prefer user ID format for clarity, but numeric IDs are also valid
         if destination:
-            # Remove ! prefix if present to check if it's numeric
-            dest_clean = destination.lstrip("!")
-            if dest_clean.isdigit():
-                # Convert numeric ID to user ID format for consistency
-                # This uses _getOrCreateByNum or derives from hex format
-                converted = self._convert_numeric_to_user_id(dest_clean)
-                if converted:
-                    destination = converted
-                    LOGGER.debug(
-                        "Converted numeric destination %s to user ID %s before sending",
-                        dest_clean,
-                        converted,
-                    )
-                else:
-                    # Fallback: use numeric ID as-is (Meshtastic accepts this)
-                    destination = dest_clean
-            elif not destination.startswith("!"):
-                # User ID without ! prefix - add it
-                destination = "!" + destination
-            # If it already starts with ! and is hex, use as-is
+            destination = self._resolve_destination(destination)
 
         payload_bytes = payload if isinstance(payload, bytes) else str(payload).encode("utf-8")
         send_start = time.time()
@@ -298,13 +302,50 @@ class SerialRadioAdapter:
             payload_bytes,
             destinationId=destination,
             wantAck=True,  # Reliable delivery with retries
-            portNum=portnum,
+            portNum=self._portnum,
         )
         send_time = time.time() - send_start
         LOGGER.info(
             "[RADIO] Sent %d bytes to %s in %.3fs", len(payload_bytes), destination, send_time
         )
 
+    def _resolve_destination(self, destination: str) -> str:
+        """Normalize a destination for sendData, memoized per destination string.
+
+        Every chunk of a message goes to the same destination, so the prefix and
+        numeric-ID handling below only needs to run once per peer.
+        """
+        cached = self._destination_cache.get(destination)
+        if cached is not None:
+            return cached
+
+        # Meshtastic sendData accepts both numeric IDs and user IDs - both work equivalently
+        # We prefer user ID format for clarity, but numeric IDs are also valid
+        # Remove ! prefix if present to check if it's numeric
+        dest_clean = destination.lstrip("!")
+        if dest_clean.isdigit():
+            # Convert numeric ID to user ID format for consistency
+            # This uses _getOrCreateByNum or derives from hex format
+            converted = self._convert_numeric_to_user_id(dest_clean)
+            if not converted:
+                # Fallback: use numeric ID as-is (Meshtastic accepts this); not cached
+                # so a later lookup can still succeed.
+                return dest_clean
+            LOGGER.debug(
+                "Converted numeric destination %s to user ID %s before sending",
+                dest_clean,
+                converted,
+            )
+            resolved = converted
+        elif not destination.startswith("!"):
+            # User ID without ! prefix - add it
+            resolved = "!" + destination
+        else:
+            # Already starts with ! and is hex, use as-is
+            resolved = destination
+        self._destination_cache[destination] = resolved
+        return resolved
+
     def _convert_numeric_to_user_id(self, numeric_id: str) -> str | None:
         """Convert a numeric node ID to user ID format.
 
@@ -313,31 +354,25 @@ class SerialRadioAdapter:
         This matches Meshtastic's default behavior where user ID = hex of numeric ID.
         """
         # Check cache first
-        if numeric_id in self._numeric_to_user_id:
-            return self._numeric_to_user_id[numeric_id]
+        cached = self._numeric_to_user_id.get(numeric_id)
+        if cached is not None:
+            return cached
 
         try:
             numeric_id_int = int(numeric_id)
 
             # Use _getOrCreateByNum to ensure node entry exists (creates placeholder with derived user ID)
-            if hasattr(self._interface, "_getOrCreateByNum"):
-                node_info = self._interface._getOrCreateByNum(numeric_id_int)
-                if node_info:
-                    # Extract user ID from the node info
-                    if isinstance(node_info, dict):
-                        user_info = node_info.get("user")
-                        if user_info and isinstance(user_info, dict):
-                            user_id = user_info.get("id")
-                            if user_id:
-                                self._numeric_to_user_id[numeric_id] = user_id
-                                return user_id
-                    elif hasattr(node_info, "user"):
-                        user_obj = node_info.user
-                        if hasattr(user_obj, "id"):
-                            user_id = user_obj.id
-                            if user_id:
-                                self._numeric_to_user_id[numeric_id] = user_id
-                                return user_id
+            get_or_create = getattr(self._interface, "_getOrCreateByNum", None)
+            if get_or_create is not None:
+                user_id = _user_id_from_node_info(get_or_create(numeric_id_int))
+                if user_id:
+                    LOGGER.debug(
+                        "Derived user ID %s from numeric ID %s via _getOrCreateByNum",
+                        user_id,
+                        numeric_id,
+                    )
+                    self._numeric_to_user_id[numeric_id] = user_id
+                    return user_id
 
             # Fallback: derive user ID directly from numeric ID (hex format)
             # This is the default Meshtastic format: !{8-digit-hex}
@@ -356,38 +391,55 @@ class SerialRadioAdapter:
     def receive(self, timeout: float) -> tuple[str, bytes] | None:  # type: ignore[override]
         # If pubsub is available, use the queue
         if self._subscribed:
-            try:
-                if LOGGER.isEnabledFor(logging.DEBUG):
-                    LOGGER.debug(
-                        "[RADIO] Queue size before receive: %d",
-                        self._message_queue.qsize(),
-                    )
-                sender, payload = self._message_queue.get(timeout=timeout)
+            if LOGGER.isEnabledFor(logging.DEBUG):
                 LOGGER.debug(
-                    "Retrieved message from queue: sender=%s (isdigit=%s)",
-                    sender,
-                    sender.isdigit() if sender else False,
+                    "[RADIO] Queue size before receive: %d",
+                    len(self._message_queue),
                 )
-                # Try to convert numeric ID to user ID if needed
-                if sender and sender.isdigit():
-                    LOGGER.debug("Attempting to convert numeric ID %s to user ID", sender)
-                    converted = self._convert_numeric_to_user_id(sender)
-                    if converted:
-                        LOGGER.debug(
-                            "Converted numeric ID %s to user ID %s on receive", sender, converted
-                        )
-                        return (converted, payload)
-                    else:
-                        LOGGER.debug("Could not convert numeric ID %s to user ID", sender)
-                return (sender, payload)
-            except queue.Empty:
+            item = self._message_queue.get(timeout)
+            if item is None:
                 return None
+            return self._normalize_sender(item)
 
         # Fallback: poll the interface (may not work for all versions)
         # This is a workaround - ideally we'd use pubsub
         time.sleep(timeout)
         return None
 
+    def receive_batch(
+        self, max_items: int = 32, timeout: float = 0.5
+    ) -> list[tuple[str, bytes]]:
+        """Receive up to ``max_items`` queued packets in arrival order.
+
+        Blocks up to ``timeout`` for the first packet only; anything else already
+        queued is drained without waiting.
+        """
+        if not self._subscribed:
+            time.sleep(timeout)
+            return []
+        batch = self._message_queue.get_batch(max_items, timeout)
+        return [self._normalize_sender(item) for item in batch]
+
+    def _normalize_sender(self, item: tuple[str, bytes]) -> tuple[str, bytes]:
+        sender, payload = item
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Retrieved message from queue: sender=%s (isdigit=%s)",
+                sender,
+                sender.isdigit() if sender else False,
+            )
+        # Try to convert numeric ID to user ID if needed
+        if sender and sender.isdigit():
+            LOGGER.debug("Attempting to convert numeric ID %s to user ID", sender)
+            converted = self._convert_numeric_to_user_id(sender)
+            if converted:
+                LOGGER.debug(
+                    "Converted numeric ID %s to user ID %s on receive", sender, converted
+                )
+                return (converted, payload)
+            LOGGER.debug("Could not convert numeric ID %s to user ID", sender)
+        return (sender, payload)
+
     def close(self) -> None:
         """Close the underlying serial interface."""
         try:
@@ -6,7 +6,7 @@ import logging
 import time
 from typing import Dict, Optional, TypedDict, List, Set, Tuple
 
-from message import MessageEnvelope, parse_chunk, reconstruct_message
+from message import FLAG_UNCOMPRESSED, MessageEnvelope, parse_chunk, reconstruct_message
 
 __all__ = ["MessageBucket", "MessageReassembler"]
 
@@ -19,6 +19,7 @@ class MessageBucket(TypedDict):
     total: int
     created: float
     ttl: float
+    compressed: bool
 
 
 class MessageReassembler:
@@ -119,7 +120,7 @@ class MessageReassembler:
         """
         now = time.time()
         try:
-            _flags, chunk_id, chunk_seq, chunk_total, chunk_data = parse_chunk(chunk)
+            flags, chunk_id, chunk_seq, chunk_total, chunk_data = parse_chunk(chunk)
         except ValueError as exc:
             logger.debug("[REASSEMBLY] Failed to parse chunk: %s", exc)
             return None, None
@@ -131,6 +132,7 @@ class MessageReassembler:
                 total=chunk_total,
                 created=now,
                 ttl=self._effective_ttl(chunk_total),
+                compressed=not flags & FLAG_UNCOMPRESSED,
             ),
         )
         # Update TTL if total_chunks increases
@@ -196,7 +198,7 @@ class MessageReassembler:
             del self._buckets[chunk_id]
             self._nack_counts.pop(chunk_id, None)
             self._nack_state.pop(chunk_id, None)
-            message = reconstruct_message(segments)
+            message = reconstruct_message(segments, bucket["compressed"])
             return message, None
 
         expected_indices = set(range(1, bucket["total"] + 1))
@@ -68,7 +68,7 @@ class InMemoryRadio:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkProgress:
     """Tracks the most recent chunk or ACK for a given message prefix."""
 
@@ -172,6 +172,13 @@ class MeshtasticTransport:
         self._enable_spool = enable_spool
         self._disable_dedupe = disable_dedupe
         
+        # Radios that can drain several packets per call (SerialRadioAdapter) feed
+        # a local backlog that receive_message consumes before asking again.
+        self._receive_batch: Callable[..., List[Tuple[str, bytes]]] | None = getattr(
+            radio, "receive_batch", None
+        )
+        self._rx_backlog: deque[Tuple[str, bytes]] = deque()
+
         # Internal state for non-blocking transport
         self._active_chunks: Dict[str, List[bytes]] = {}
         self._active_progress: Dict[str, int] = {}
@@ -480,7 +487,7 @@ class MeshtasticTransport:
                 break
 
             receive_timeout = max(0.05, min(remaining, 0.5))
-            received = self.radio.receive(receive_timeout)
+            received = self._receive_chunk(receive_timeout)
             if received is None:
                 # Reduced sleep: 2ms when actively receiving, longer otherwise
                 # This balances latency vs CPU usage
@@ -550,6 +557,18 @@ class MeshtasticTransport:
 
         return None, None
 
+    def _receive_chunk(self, timeout: float) -> Optional[Tuple[str, bytes]]:
+        """Next raw chunk from the radio, draining batched receives in order."""
+        if self._rx_backlog:
+            return self._rx_backlog.popleft()
+        if self._receive_batch is None:
+            return self.radio.receive(timeout)
+        batch = self._receive_batch(timeout=timeout)
+        if not batch:
+            return None
+        self._rx_backlog.extend(batch)
+        return self._rx_backlog.popleft()
+
     def process_outbox(self) -> None:
         """Public shim for internal outbox processing; intended for gateway/client usage."""
         self._process_outbox()
@@ -0,0 +1,384 @@
+"""Unit tests for the UI backend service state bookkeeping."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+UI_SERVICE = ROOT / "ui_service"
+if UI_SERVICE.exists() and str(UI_SERVICE) not in sys.path:
+    sys.path.insert(0, str(UI_SERVICE))
+
+from backend_service import BackendService
+from message import MessageEnvelope
+
+
+@pytest.fixture
+def backend():
+    """BackendService without its polling thread started."""
+    return BackendService()
+
+
+def _request(command: str = "echo", data: dict | None = None) -> MessageEnvelope:
+    return MessageEnvelope(id="req-1", type="request", command=command, data=data or {})
+
+
+def test_gateway_event_tracks_sorted_radios(backend) -> None:
+    backend.start_gateway()
+    backend.stop_gateway()
+    for sender in ("!0000000c", "!0000000a", "!0000000b", "!0000000a"):
+        backend._record_gateway_event(sender, _request(), None)
+
+    snapshot = backend.snapshot()
+    assert snapshot.connected_radios == ["!0000000a", "!0000000b", "!0000000c"]
+    assert len(snapshot.gateway_traffic) == 4
+
+
+def test_gateway_event_records_http_url_and_payload(backend) -> None:
+    envelope = _request("http_request", {"url": "https://example.com"})
+    backend._record_gateway_event("!0000000a", envelope, {"seq": 2, "total": 3})
+
+    snapshot = backend.snapshot()
+    assert snapshot.gateway_traffic[0].endswith("!0000000a http_request https://example.com")
+    assert snapshot.gateway_last_payload == '{"url": "https://example.com"}'
+    assert snapshot.gateway_last_chunks_total == 3
+    assert snapshot.last_rx_time is not None
+
+
+def test_gateway_traffic_ring_keeps_newest_entries(backend) -> None:
+    import backend_service
+
+    total = backend_service.GATEWAY_LOG_SIZE + 5
+    for i in range(total):
+        backend._record_gateway_event(f"!{i:08x}", _request(), None)
+
+    traffic = backend.snapshot().gateway_traffic
+    assert len(traffic) == backend_service.GATEWAY_LOG_SIZE
+    assert f"!{total - 1:08x}" in traffic[0]
+    assert f"!{5:08x}" in traffic[-1]
+
+    backend.start_gateway()
+    backend.stop_gateway()
+    assert backend.snapshot().gateway_traffic == []
+
+
+def test_snapshot_is_detached_from_live_state(backend) -> None:
+    backend._record_gateway_event("!0000000a", _request(), None)
+    snapshot = backend.snapshot()
+    backend._record_gateway_event("!0000000b", _request(), None)
+
+    assert snapshot.connected_radios == ["!0000000a"]
+    assert len(snapshot.gateway_traffic) == 1
+
+
+def test_snapshot_is_cached_until_state_changes(backend) -> None:
+    first = backend.snapshot()
+    assert backend.snapshot() is first
+
+    backend._record_tx_event()
+    second = backend.snapshot()
+    assert second is not first
+    assert second.last_tx_time is not None and first.last_tx_time is None
+
+
+def test_snapshot_is_frozen_and_replaced_by_writers(backend) -> None:
+    import dataclasses
+
+    snapshot = backend.snapshot()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.mode = "client"  # type: ignore[misc]
+
+    backend._record_client_progress({"phase": "send", "sent_chunks": 2, "total_chunks": 5})
+    assert snapshot.client_send_chunks_sent == 0
+    assert backend.snapshot().client_send_chunks_sent == 2
+
+
+def test_detect_radio_ports_reuses_recent_scan(monkeypatch) -> None:
+    import backend_service
+
+    calls = []
+
+    def fake_scan():
+        calls.append(1)
+        return ["/dev/ttyUSB0"], None
+
+    monkeypatch.setattr(backend_service, "_scan_radio_ports", fake_scan)
+    monkeypatch.setattr(backend_service, "_port_cache", None)
+
+    ports, error = backend_service.detect_radio_ports()
+    ports.append("mutated")
+    assert backend_service.detect_radio_ports() == (["/dev/ttyUSB0"], None)
+    assert error is None
+    assert len(calls) == 1
+
+    backend_service.detect_radio_ports(max_age=0)
+    backend_service.detect_radio_ports(max_age=0)
+    assert len(calls) == 3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX open/flock probe")
+def test_probe_port_accessibility_uses_os_open(tmp_path) -> None:
+    import backend_service
+
+    device = tmp_path / "ttyUSB0"
+    device.write_bytes(b"")
+    assert backend_service._probe_port_accessibility(str(device)) == (True, None)
+
+    ok, error = backend_service._probe_port_accessibility(str(tmp_path / "missing"))
+    assert not ok and error
+
+
+def test_probe_candidates_skip_non_usb_serial_nodes() -> None:
+    import backend_service
+
+    for port in ("/dev/ttyUSB0", "/dev/ttyACM1", "/dev/cu.usbserial-0001", "/dev/cu.usbmodem101", "COM3"):
+        assert backend_service._is_probe_candidate(port), port
+    for port in ("/dev/ttyS0", "/dev/cu.Bluetooth-Incoming-Port", "/dev/ttyAMA0", "/dev/rfcomm0"):
+        assert not backend_service._is_probe_candidate(port), port
+
+
+def test_probe_ports_keeps_scan_order_and_skips_connected_port(backend, monkeypatch) -> None:
+    import backend_service
+
+    probed = []
+
+    def fake_probe(port):
+        probed.append(port)
+        return port != "/dev/ttyUSB2", None
+
+    monkeypatch.setattr(backend_service, "_probe_port_accessibility", fake_probe)
+    backend._radio_port = "/dev/ttyACM0"
+    ports = ["/dev/ttyUSB1", "/dev/ttyACM0", "/dev/ttyUSB2", "/dev/ttyS0", "/dev/ttyUSB3"]
+    try:
+        assert backend._probe_ports(ports) == ["/dev/ttyUSB1", "/dev/ttyACM0", "/dev/ttyUSB3"]
+    finally:
+        backend._probe_pool.shutdown()
+    assert sorted(probed) == ["/dev/ttyUSB1", "/dev/ttyUSB2", "/dev/ttyUSB3"]
+
+
+def test_scan_radio_ports_skips_bluetooth_nodes(monkeypatch) -> None:
+    import backend_service
+
+    class FakeUtil:
+        @staticmethod
+        def findPorts():  # noqa: N802
+            return ["/dev/ttyUSB0"]
+
+    class FakeListPorts:
+        @staticmethod
+        def comports():
+            return [
+                type("Port", (), {"device": device})()
+                for device in ("/dev/cu.Bluetooth-Incoming-Port", "/dev/rfcomm0", "/dev/ttyACM0")
+            ]
+
+    monkeypatch.setattr(backend_service, "meshtastic_util", FakeUtil)
+    monkeypatch.setattr(backend_service, "list_ports", FakeListPorts)
+    assert backend_service._scan_radio_ports() == (["/dev/ttyUSB0", "/dev/ttyACM0"], None)
+
+
+def test_transport_wrapper_observes_send_and_forwards() -> None:
+    from backend_service import TransportWrapper
+    from transport import InMemoryRadio, MeshtasticTransport
+
+    transport = MeshtasticTransport(InMemoryRadio("node-a"), segment_size=120)
+    sends = []
+    wrapper = TransportWrapper(transport, on_send=lambda: sends.append(1))
+
+    wrapper.send_message(_request(), "node-b")
+    assert sends == [1]
+    assert wrapper.get_sent_chunk_count("req-1") == 1
+    assert wrapper.segment_size == 120
+    assert wrapper.radio is transport.radio
+    assert wrapper.should_process("node-b", _request())
+
+
+def test_poll_delay_backs_off_once_radio_connected(backend) -> None:
+    import backend_service
+
+    assert backend._next_poll_delay() == backend._poll_interval
+    backend._radio = object()
+    assert backend._next_poll_delay() == max(
+        backend._poll_interval, backend_service.PORT_CACHE_TTL_SECONDS
+    )
+    backend._radio = None
+
+
+def test_poll_delay_grows_while_ports_are_stable(backend) -> None:
+    import backend_service
+
+    backend._radio = object()
+    base = backend._next_poll_delay()
+    backend._stable_polls = 1
+    assert base < backend._next_poll_delay() <= backend_service.MAX_POLL_INTERVAL_SECONDS
+    backend._stable_polls = 16
+    assert backend._next_poll_delay() == max(base, backend_service.MAX_POLL_INTERVAL_SECONDS)
+
+    backend.set_radio_port(None)
+    assert backend._stable_polls == 0
+    assert backend._wake_event.is_set()
+
+
+def test_resolve_local_radio_id() -> None:
+    from backend_service import _resolve_local_radio_id
+    from transport import InMemoryRadio
+
+    class Interface:
+        def getMyNodeInfo(self):  # noqa: N802
+            return {"user": {"id": "!deadbeef"}}
+
+    class SerialLike:
+        _interface = Interface()
+
+    assert _resolve_local_radio_id(InMemoryRadio("node-a")) == "node-a"
+    assert _resolve_local_radio_id(SerialLike()) == "!deadbeef"
+    assert _resolve_local_radio_id(object()) is None
+
+
+def test_gateway_thread_records_received_messages(backend) -> None:
+    import time
+
+    from transport import InMemoryRadio, InMemoryRadioBus, MeshtasticTransport
+
+    bus = InMemoryRadioBus()
+    backend._radio = InMemoryRadio("gateway", bus)
+    backend._transport = MeshtasticTransport(backend._radio)
+    client = MeshtasticTransport(InMemoryRadio("client", bus))
+
+    backend.start_gateway()
+    try:
+        client.send_message(_request(), "gateway")
+        deadline = time.time() + 5.0
+        while time.time() < deadline and not backend.snapshot().gateway_traffic:
+            time.sleep(0.02)
+    finally:
+        backend.stop_gateway()
+
+    snapshot = backend.snapshot()
+    assert snapshot.connected_radios == ["client"]
+    assert snapshot.gateway_traffic[0].endswith("client echo")
+    assert snapshot.local_radio_id == "gateway"
+
+
+def test_timestamp_is_reused_within_a_second(monkeypatch) -> None:
+    import backend_service
+
+    now = [1_700_000_000.2]
+    monkeypatch.setattr(backend_service.time, "time", lambda: now[0])
+    monkeypatch.setattr(backend_service, "_TS_CACHE", (0, ""))
+    first = backend_service._timestamp()
+    now[0] += 0.5
+    assert backend_service._timestamp() is first
+    now[0] += 1.0
+    assert backend_service._timestamp() == time.strftime("%H:%M:%S", time.localtime(1_700_000_001))
+
+
+def test_render_payload_views() -> None:
+    import base64
+
+    import backend_service
+
+    data = {"result": {"content_b64": base64.b64encode(b"hello").decode("ascii")}, "pad": "x" * 200}
+    formatted, raw, decoded = backend_service._render_payload(data)
+    assert raw.startswith('{"result": {"content_b64": ')
+    assert formatted == raw[:157] + "..."
+    assert decoded == "hello"
+    assert backend_service._render_payload(None) == (None, "null", None)
+
+
+def test_client_history_is_bounded_newest_first(backend) -> None:
+    import backend_service
+
+    response = MessageEnvelope(id="resp", type="response", command="echo", data={})
+    for i in range(backend_service.CLIENT_HISTORY_SIZE + 2):
+        backend._record_client_response(response, "ok", f"entry-{i}")
+
+    history = backend.snapshot().client_history
+    assert history[0] == f"entry-{backend_service.CLIENT_HISTORY_SIZE + 1}"
+    assert len(history) == backend_service.CLIENT_HISTORY_SIZE
+
+
+def test_spool_depth_reads_are_throttled(backend, monkeypatch) -> None:
+    import backend_service
+
+    reads = []
+
+    def fake_depth(transport):
+        reads.append(1)
+        return len(reads)
+
+    monkeypatch.setattr(backend_service, "_get_spool_depth", fake_depth)
+    for _ in range(5):
+        backend._record_tx_event()
+    assert reads == [1]
+    assert backend.snapshot().spool_depth == 1
+
+    backend._last_spool_update -= backend_service.SPOOL_DEPTH_INTERVAL_SECONDS * 2
+    backend._record_tx_event()
+    assert backend.snapshot().spool_depth == 2
+
+
+def test_payload_decoding_runs_outside_state_lock(backend, monkeypatch) -> None:
+    import backend_service
+
+    held = []
+    real_decode = backend_service._decode_content
+
+    def checking_decode(payload):
+        held.append(backend._lock.locked())
+        return real_decode(payload)
+
+    monkeypatch.setattr(backend_service, "_decode_content", checking_decode)
+    backend._record_gateway_event("!0000000a", _request(data={"content_b64": "aGk="}), None)
+    response = MessageEnvelope(id="resp", type="response", command="echo", data={"content_b64": "aGk="})
+    backend._record_client_response(response, "ok", "entry")
+
+    assert held == [False, False]
+    snapshot = backend.snapshot()
+    assert snapshot.gateway_last_payload_decoded == "hi"
+    assert snapshot.client_last_payload_decoded == "hi"
+
+
+def test_mode_config_is_cached_per_mtime(tmp_path, monkeypatch) -> None:
+    import os
+
+    import backend_service
+
+    monkeypatch.setattr(backend_service, "MODES_DIR", tmp_path)
+    mode_file = tmp_path / "fast.json"
+    mode_file.write_text('{"transport": {"segment_size": 120}}', encoding="utf-8")
+
+    first = backend_service._load_mode_config("fast")
+    first["transport"]["segment_size"] = 1
+    assert backend_service._load_mode_config("fast") == {"transport": {"segment_size": 120}}
+
+    mode_file.write_text('{"transport": {"segment_size": 180}}', encoding="utf-8")
+    stat = mode_file.stat()
+    os.utime(mode_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert backend_service._load_mode_config("fast") == {"transport": {"segment_size": 180}}
+    assert backend_service._load_mode_config("missing") == {}
+
+
+def test_unchanged_updates_keep_the_published_state(backend) -> None:
+    backend._update_state(radio_detected=False, last_error=None, accessible_ports=[])
+    first = backend.snapshot()
+    backend._update_state(radio_detected=False, last_error=None, accessible_ports=[])
+    assert backend.snapshot() is first
+
+    backend._update_state(radio_detected=False, last_error="gone")
+    assert backend.snapshot().last_error == "gone"
+
+
+def test_decode_content_handles_missing_and_invalid_base64() -> None:
+    import backend_service
+
+    decode = backend_service._decode_content
+    assert decode(None) is None
+    assert decode({"result": {"status": 200}}) is None
+    assert decode({"content_b64": "", "result": {"content_b64": "aGk="}}) == "hi"
+    assert decode({"content_b64": "not base64!"}) is None
+    assert decode({"content_b64": "/w=="}) == "ff"
@@ -1,9 +1,19 @@
 """Unit tests for MessageEnvelope and chunking functions."""
 import struct
+
+import msgpack
+import pytest
+import zstandard as zstd
+
 from message import (
+    FLAG_UNCOMPRESSED,
+    HEADER_STRUCT,
+    MAGIC,
+    VERSION,
     MessageEnvelope,
     chunk_envelope,
     parse_chunk,
+    parse_chunk_header,
     reconstruct_message,
     build_nack_chunk,
     parse_nack_payload,
@@ -82,11 +92,12 @@ def test_chunk_envelope_single_chunk() -> None:
 
     assert len(chunks) == 1
     flags, short_id, seq, total, data = parse_chunk(chunks[0])
-    assert flags == 0
+    assert flags == FLAG_UNCOMPRESSED
     assert short_id == "short-me"
     assert seq == 1
     assert total == 1
     assert data
+    assert parse_chunk_header(chunks[0]) == (flags, short_id, seq, total)
 
 
 def test_chunk_envelope_multiple_chunks() -> None:
@@ -156,8 +167,9 @@ def test_chunk_and_reconstruct_roundtrip() -> None:
     )
 
     chunks = chunk_envelope(original, segment_size=40)
-    segments = [parse_chunk(chunk)[4] for chunk in chunks]
-    reconstructed = reconstruct_message(segments)
+    parsed = [parse_chunk(chunk) for chunk in chunks]
+    compressed = not parsed[0][0] & FLAG_UNCOMPRESSED
+    reconstructed = reconstruct_message([p[4] for p in parsed], compressed)
 
     assert reconstructed.id == original.id
     assert reconstructed.type == original.type
@@ -370,3 +382,37 @@ def test_parse_nack_payload_with_extra_bytes() -> None:
     assert parsed == [10, 20, 30]
 
 
+def test_small_envelope_skips_compression() -> None:
+    """Small envelopes are sent as plain MessagePack and flagged in the header."""
+    envelope = MessageEnvelope(id="small-envelope", type="request", command="health")
+
+    chunks = chunk_envelope(envelope, segment_size=120)
+    flags, _short_id, _seq, _total, payload = parse_chunk(chunks[0])
+
+    assert flags & FLAG_UNCOMPRESSED
+    assert reconstruct_message([payload], compressed=False).command == "health"
+
+
+def test_chunk_header_version() -> None:
+    """New chunks carry VERSION; unknown versions are rejected."""
+    chunk = chunk_envelope(MessageEnvelope(id="v", type="request", command="health"))[0]
+
+    assert chunk[2] == VERSION == 2
+    with pytest.raises(ValueError):
+        parse_chunk_header(chunk[:2] + bytes([VERSION + 1]) + chunk[3:])
+
+
+def test_reconstruct_legacy_compressed_payload() -> None:
+    """Version 1 chunks, whose senders always compress, still decode."""
+    payload = zstd.ZstdCompressor(level=1).compress(
+        msgpack.packb({"i": "legacy-1", "t": "request", "cmd": "health"}, use_bin_type=True)
+    )
+    short_id = b"legacy-1"
+    chunk = HEADER_STRUCT.pack(MAGIC, 1, 0, short_id, 1, 1) + payload
+
+    flags, _short_id, _seq, _total, data = parse_chunk(chunk)
+
+    assert flags == 0
+    reconstructed = reconstruct_message([data])
+    assert reconstructed.id == "legacy-1"
+    assert reconstructed.command == "health"
@@ -0,0 +1,186 @@
+"""Unit tests for the serial radio adapter (no hardware required)."""
+
+import os
+import threading
+import time
+
+from message import MessageEnvelope, chunk_envelope
+from radio import SerialRadioAdapter, _ReceiveRing
+from transport import MeshtasticTransport
+
+
+class FakeInterface:
+    """Stand-in for meshtastic SerialInterface that records sends."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[bytes, str, int]] = []
+        self.closed = False
+
+    def sendData(self, payload, destinationId=None, wantAck=False, portNum=None):  # noqa: N802,N803
+        self.sent.append((payload, destinationId, portNum))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _private_packet(payload: bytes, from_id: str = "!00000001") -> dict:
+    return {
+        "fromId": from_id,
+        "from": 1,
+        "decoded": {"portnum": "PRIVATE_APP", "payload": payload},
+    }
+
+
+def _chunk(message_id: str = "radio-test") -> bytes:
+    envelope = MessageEnvelope(id=message_id, type="request", command="echo", data={})
+    return chunk_envelope(envelope, 100)[0]
+
+
+def test_receive_ring_preserves_order() -> None:
+    ring: _ReceiveRing[int] = _ReceiveRing()
+    for i in range(5):
+        ring.put(i)
+    assert len(ring) == 5
+    assert [ring.get(0.01) for _ in range(5)] == [0, 1, 2, 3, 4]
+    assert ring.get(0.01) is None
+
+
+def test_receive_ring_wakes_blocked_consumer() -> None:
+    ring: _ReceiveRing[str] = _ReceiveRing()
+    threading.Timer(0.05, ring.put, args=("late",)).start()
+    start = time.time()
+    assert ring.get(2.0) == "late"
+    assert time.time() - start < 1.0
+
+
+def test_adapter_queues_private_app_packets() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        chunk = _chunk()
+        adapter._on_receive(_private_packet(chunk), interface)
+        assert adapter.receive(0.1) == ("!00000001", chunk)
+        assert adapter.receive(0.01) is None
+    finally:
+        adapter.close()
+    assert interface.closed
+
+
+def test_adapter_ignores_other_interfaces_and_ports() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        chunk = _chunk()
+        adapter._on_receive(_private_packet(chunk), object())
+        adapter._on_receive(
+            {"fromId": "!00000001", "decoded": {"portnum": "TEXT_MESSAGE_APP", "payload": b"hi"}},
+            interface,
+        )
+        assert adapter.receive(0.01) is None
+    finally:
+        adapter.close()
+
+
+def test_adapter_drops_duplicate_chunks() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        chunk = _chunk()
+        adapter._on_receive(_private_packet(chunk), interface)
+        adapter._on_receive(_private_packet(chunk), interface)
+        assert adapter.receive(0.1) is not None
+        assert adapter.receive(0.01) is None
+    finally:
+        adapter.close()
+
+
+def test_adapter_accepts_numeric_private_app_portnum() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        chunk = _chunk()
+        packet = _private_packet(chunk)
+        packet["decoded"]["portnum"] = 80
+        adapter._on_receive(packet, interface)
+        assert adapter.receive(0.1) == ("!00000001", chunk)
+    finally:
+        adapter.close()
+
+
+def test_adapter_derives_user_id_from_numeric_sender() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        chunk = _chunk()
+        packet = _private_packet(chunk, from_id=None)
+        packet["from"] = 0x1234ABCD
+        adapter._on_receive(packet, interface)
+        assert adapter.receive(0.1) == ("!1234abcd", chunk)
+        assert adapter._numeric_to_user_id[str(0x1234ABCD)] == "!1234abcd"
+    finally:
+        adapter.close()
+
+
+def test_adapter_sends_on_private_app_port() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        adapter.send("!0000abcd", b"payload")
+        adapter.send("0000abcd", b"again")
+    finally:
+        adapter.close()
+    assert interface.sent == [
+        (b"payload", "!0000abcd", 256),
+        (b"again", "!0000abcd", 256),
+    ]
+
+
+def test_receive_ring_get_batch_drains_in_order() -> None:
+    ring: _ReceiveRing[int] = _ReceiveRing()
+    assert ring.get_batch(4, 0.01) == []
+    for i in range(6):
+        ring.put(i)
+    assert ring.get_batch(4, 0.01) == [0, 1, 2, 3]
+    assert ring.get_batch(4, 0.01) == [4, 5]
+
+
+def test_transport_consumes_batched_receives() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        envelope = MessageEnvelope(
+            id="batch-test", type="request", command="echo", data={"text": os.urandom(300).hex()}
+        )
+        chunks = chunk_envelope(envelope, 100)
+        assert len(chunks) > 1
+        for chunk in chunks:
+            adapter._on_receive(_private_packet(chunk), interface)
+        transport = MeshtasticTransport(adapter, segment_size=100)
+        sender, message = transport.receive_message(timeout=0.5)
+        assert sender == "!00000001"
+        assert message is not None and message.id == "batch-test"
+    finally:
+        adapter.close()
+
+
+def test_adapter_accepts_bytearray_payloads() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        chunk = _chunk()
+        adapter._on_receive(_private_packet(bytearray(chunk)), interface)
+        assert adapter.receive(0.1) == ("!00000001", chunk)
+    finally:
+        adapter.close()
+
+
+def test_adapter_resolves_numeric_destinations_once() -> None:
+    interface = FakeInterface()
+    adapter = SerialRadioAdapter(interface)
+    try:
+        adapter.send("305441741", b"one")
+        adapter.send("305441741", b"two")
+    finally:
+        adapter.close()
+    assert [dest for _, dest, _ in interface.sent] == ["!1234abcd", "!1234abcd"]
+    assert adapter._destination_cache == {"305441741": "!1234abcd"}
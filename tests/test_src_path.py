@@ -0,0 +1,45 @@
+"""Unit tests for locating src/ from the UI service."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+UI_SERVICE = ROOT / "ui_service"
+if UI_SERVICE.exists() and str(UI_SERVICE) not in sys.path:
+    sys.path.insert(0, str(UI_SERVICE))
+
+import src_path
+
+
+def test_walks_to_repo_src_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MESHTASTIC_BRIDGE_SRC", raising=False)
+    module = importlib.reload(src_path)
+    assert module.SRC == ROOT / "src"
+    assert module.ROOT == ROOT
+
+
+def test_ensure_src_on_path_adds_src_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MESHTASTIC_BRIDGE_SRC", raising=False)
+    module = importlib.reload(src_path)
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if p != str(module.SRC)])
+    module.ensure_src_on_path()
+    module.ensure_src_on_path()
+    assert sys.path.count(str(module.SRC)) == 1
+
+
+def test_env_override_skips_the_walk(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    override = tmp_path / "src"
+    monkeypatch.setenv("MESHTASTIC_BRIDGE_SRC", str(override))
+    try:
+        module = importlib.reload(src_path)
+        assert module.SRC == override
+        assert module.ROOT == tmp_path
+    finally:
+        monkeypatch.delenv("MESHTASTIC_BRIDGE_SRC")
+        importlib.reload(src_path)
+
@@ -0,0 +1,344 @@
+"""Unit tests for the terminal UI rendering helpers."""
+
+from __future__ import annotations
+
+import io
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+UI_SERVICE = ROOT / "ui_service"
+if UI_SERVICE.exists() and str(UI_SERVICE) not in sys.path:
+    sys.path.insert(0, str(UI_SERVICE))
+
+import ui
+
+
+def test_gradient_text_is_built_once_per_input() -> None:
+    first = ui.create_gradient_text(ui.MESHTASTIC_LOGO, "#00ffff", "#0033ff")
+    assert ui.create_gradient_text(ui.MESHTASTIC_LOGO, "#00ffff", "#0033ff") is first
+    assert first.plain.strip().splitlines() == ui.MESHTASTIC_LOGO.strip().splitlines()
+    assert ui.create_gradient_text("a\nb", "#000000", "#ffffff") is not first
+
+
+def test_key_reader_blocking_get_returns_queued_key() -> None:
+    reader = ui.KeyReader()
+    assert reader.get_key_blocking(0.01) is None
+    reader._push("enter")
+    assert reader.get_key_blocking(1.0) == "enter"
+
+
+def test_key_reader_get_keys_drains_queue() -> None:
+    reader = ui.KeyReader()
+    assert reader.get_keys() == []
+    for key in ("down", "down", "enter"):
+        reader._push(key)
+    assert reader.get_keys() == ["down", "down", "enter"]
+    assert reader.get_key() is None
+
+
+def test_load_modes_rescans_only_when_directory_changes(tmp_path, monkeypatch) -> None:
+    import os
+
+    monkeypatch.setattr(ui, "MODES_DIR", tmp_path)
+    monkeypatch.setattr(ui, "_modes_cache", None)
+    assert ui._load_modes() == ["general"]
+
+    (tmp_path / "fast.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert ui._load_modes() == ["fast"]
+
+    cached = ui._modes_cache
+    ui._load_modes().append("mutated")
+    assert ui._modes_cache is cached
+    assert ui._load_modes() == ["fast"]
+
+
+def test_footer_is_shared_per_view() -> None:
+    menu = ui._render_footer(ui.UIState(view="menu"))
+    assert ui._render_footer(ui.UIState(view="menu")) is menu
+    gateway = ui._render_footer(ui.UIState(view="gateway"))
+    assert "stop gateway" in gateway.plain
+    assert f"v{ui.BRIDGE_VERSION}" in menu.plain
+
+
+def test_wrap_payload_is_cached_per_payload_and_width() -> None:
+    payload = "word " * 40
+    lines = ui._wrap_payload(payload, 30)
+    assert all(len(line) <= 30 for line in lines)
+    assert ui._wrap_payload(payload, 30) is lines
+    assert ui._wrap_payload(payload, 60) != lines
+    assert ui._wrap_payload("", 30) == ("",)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX terminal reader")
+def test_key_reader_wakes_on_input_and_stop(monkeypatch) -> None:
+    import os
+    import pty
+
+    master, slave = pty.openpty()
+    stdin = os.fdopen(slave, "r", buffering=1)
+    monkeypatch.setattr(sys, "stdin", stdin)
+    reader = ui.KeyReader()
+    try:
+        reader.start()
+        time.sleep(0.2)  # let the reader switch the terminal to raw mode
+        os.write(master, b"x")
+        assert reader.get_key_blocking(2.0) == "x"
+        start = time.monotonic()
+        reader.stop()
+        assert not reader._thread.is_alive()
+        assert time.monotonic() - start < 0.5
+    finally:
+        stdin.close()
+        os.close(master)
+
+
+def test_static_logo_matches_direct_render() -> None:
+    from rich.align import Align
+    from rich.console import Console
+
+    console = Console(width=100, force_terminal=True, color_system="truecolor")
+    logo_text = ui.create_gradient_text(ui.MESHTASTIC_LOGO, "#00ffff", "#0033ff")
+    with console.capture() as direct:
+        console.print(Align.center(logo_text, vertical="top"))
+    for _ in range(2):
+        with console.capture() as cached:
+            console.print(ui._HEADER)
+        assert cached.get() == direct.get()
+    assert len(ui._HEADER._lines) == 1
+
+
+def test_load_version_prefers_launcher_env(monkeypatch) -> None:
+    import json
+
+    monkeypatch.setenv("MESHTASTIC_BRIDGE_VERSION", "9.9.9")
+    assert ui._load_version() == "9.9.9"
+    monkeypatch.delenv("MESHTASTIC_BRIDGE_VERSION")
+    package = json.loads((ROOT / "package.json").read_text(encoding="utf-8"))
+    assert ui._load_version() == package["version"]
+
+
+def test_gateway_body_keeps_payload_text_literal() -> None:
+    state = ui.BackendState(
+        radio_ports=["/dev/ttyUSB0"],
+        local_radio_id="!0000abcd",
+        gateway_last_payload="[bold]not markup[/]",
+        gateway_traffic=["rx 1", "tx 2"],
+    )
+    text = ui._render_gateway_body(state, ui.UIState(modes=["general"]))
+    assert "Last Payload: [bold]not markup[/]" in text.plain
+    assert text.plain.endswith("Traffic:\nrx 1\ntx 2\n")
+    start = text.plain.index("!0000abcd")
+    assert any(
+        span.start == start and span.end == start + len("!0000abcd") and span.style == ui.STYLE_OK
+        for span in text.spans
+    )
+
+
+def test_render_ui_reuses_layout_and_width() -> None:
+    console = ui.Console(width=120, height=40, file=io.StringIO())
+    state = ui.BackendState()
+    ui_state = ui.UIState(modes=["general"])
+    layout = ui.create_ui_layout()
+    assert ui.render_ui(console, state, ui_state, layout, 60) is layout
+    first_body = layout["body"].renderable
+    assert ui.render_ui(console, state, ui_state, layout, 60) is layout
+    assert layout["body"].renderable is not first_body
+    assert layout["header"].renderable is ui._HEADER
+    assert layout["footer"].renderable is ui._footer_pane("menu", ui.BRIDGE_VERSION)
+    assert isinstance(ui.render_ui(console, state, ui_state), ui.Layout)
+
+
+def test_format_timestamp_reuses_text_within_a_second() -> None:
+    ui._format_second.cache_clear()
+    assert ui._format_timestamp(None) == "none"
+    now = time.time()
+    first = ui._format_timestamp(now)
+    assert first == time.strftime("%H:%M:%S", time.localtime(int(now)))
+    assert ui._format_timestamp(int(now) + 0.5) is first
+    assert ui._format_second.cache_info().hits == 1
+
+
+def test_format_timestamp_caches_alternating_rx_and_tx(monkeypatch) -> None:
+    ui._format_second.cache_clear()
+    calls = []
+    real_strftime = time.strftime
+
+    def counting_strftime(fmt, *args):
+        calls.append(fmt)
+        return real_strftime(fmt, *args)
+
+    monkeypatch.setattr(ui.time, "strftime", counting_strftime)
+    rx, tx = 1_700_000_000.2, 1_700_000_042.7
+    for _ in range(5):
+        ui._format_timestamp(rx)
+        ui._format_timestamp(tx)
+    assert len(calls) == 2
+
+
+def test_copy_to_clipboard_prefers_native_command(monkeypatch) -> None:
+    if ui.os.name == "nt":
+        pytest.skip("POSIX clipboard commands")
+    calls = []
+
+    def fake_pipe(command, text):
+        calls.append((command[0], text))
+        return command == ["fake-copy"]
+
+    monkeypatch.setattr(ui, "_clipboard_commands", lambda: [["missing-copy"], ["fake-copy"]])
+    monkeypatch.setattr(ui, "_pipe_to_command", fake_pipe)
+    assert ui._copy_to_clipboard("payload") is True
+    assert calls == [("missing-copy", "payload"), ("fake-copy", "payload")]
+
+
+def test_clipboard_commands_follow_display_env(monkeypatch) -> None:
+    monkeypatch.setattr(ui.sys, "platform", "linux")
+    monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+    monkeypatch.delenv("DISPLAY", raising=False)
+    assert ui._clipboard_commands() == [["wl-copy"]]
+    monkeypatch.delenv("WAYLAND_DISPLAY")
+    monkeypatch.setenv("DISPLAY", ":0")
+    assert [command[0] for command in ui._clipboard_commands()] == ["xclip", "xsel"]
+
+
+def test_ui_state_uses_slots() -> None:
+    state = ui.UIState()
+    assert not hasattr(state, "__dict__")
+    state.menu_index = 1
+    with pytest.raises(AttributeError):
+        state.menu_idx = 2  # type: ignore[attr-defined]
+
+
+def test_parse_keys_splits_escape_sequences_and_bursts() -> None:
+    assert ui._parse_keys("\x1b[A\x1b[6~ab\r") == ["up", "pgdn", "a", "b", "enter"]
+    assert ui._parse_keys("\x1b") == ["esc"]
+    assert ui._parse_keys("\x1b[1;5Cx") == ["esc", "x"]
+    assert ui._parse_keys("\x10\t\x7f") == ["ctrl+p", "tab", "backspace"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX terminal reader")
+def test_read_keys_posix_joins_split_escape_sequences(monkeypatch: pytest.MonkeyPatch) -> None:
+    import codecs
+    import os
+    import threading
+
+    monkeypatch.setattr(ui, "_ESCAPE_TIMEOUT", 2.0)
+    read_fd, write_fd = os.pipe()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    try:
+        os.write(write_fd, b"\x1b")
+        threading.Timer(0.05, os.write, args=(write_fd, b"[")).start()
+        threading.Timer(0.1, os.write, args=(write_fd, b"A")).start()
+        assert ui._read_keys_posix(read_fd, decoder) == ["up"]
+
+        monkeypatch.setattr(ui, "_ESCAPE_TIMEOUT", 0.01)
+        os.write(write_fd, b"\x1b")
+        assert ui._read_keys_posix(read_fd, decoder) == ["esc"]
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_handle_key_uses_the_frame_snapshot() -> None:
+    class Backend:
+        def snapshot(self):
+            raise AssertionError("key handling should use the frame snapshot")
+
+    ui_state = ui.UIState(modes=["general"])
+    snapshot = ui.BackendState(radio_detected=False)
+    ui._handle_key("ctrl+p", ui_state, Backend(), snapshot)
+    assert ui_state.palette_open and ui_state.palette_options
+    ui._handle_key("ctrl+p", ui_state, Backend(), snapshot)
+    ui._handle_key("enter", ui_state, Backend(), snapshot)
+    assert ui_state.view == "menu"
+
+
+@pytest.mark.skipif(not hasattr(ui.signal, "SIGWINCH"), reason="POSIX resize signal")
+def test_watch_resize_sets_event_on_sigwinch() -> None:
+    import os
+
+    previous = ui.signal.getsignal(ui.signal.SIGWINCH)
+    try:
+        resized = ui._watch_resize()
+        assert resized is not None and not resized.is_set()
+        os.kill(os.getpid(), ui.signal.SIGWINCH)
+        assert resized.wait(1.0)
+    finally:
+        ui.signal.signal(ui.signal.SIGWINCH, previous)
+
+
+def test_gradient_styles_span_both_endpoints() -> None:
+    styles = ui._gradient_styles("#000000", "#ffffff", 3)
+    assert [style.color.name for style in styles] == ["#000000", "#7f7f7f", "#ffffff"]
+    assert all(style.bold for style in styles)
+    assert ui._gradient_styles("#000000", "#ffffff", 3) is styles
+    assert [style.color.name for style in ui._gradient_styles("#123456", "#ffffff", 1)] == ["#123456"]
+
+
+def test_present_wraps_frame_in_synchronized_output() -> None:
+    output = io.StringIO()
+    console = ui.Console(file=output, force_terminal=True, width=40, height=10)
+    with ui.Live(ui.Text("old"), console=console, auto_refresh=False) as live:
+        start = len(output.getvalue())
+        ui._present(live, console, ui.Text("frame"))
+        frame = output.getvalue()[start:]
+    assert frame.startswith(ui._SYNC_OUTPUT_BEGIN)
+    assert frame.endswith(ui._SYNC_OUTPUT_END)
+    assert "frame" in frame
+
+
+def test_key_reader_blocking_get_wakes_on_push() -> None:
+    import threading
+
+    reader = ui.KeyReader()
+    threading.Timer(0.05, reader._push, args=("down",)).start()
+    start = time.monotonic()
+    assert reader.get_key_blocking(2.0) == "down"
+    assert time.monotonic() - start < 1.0
+
+
+def test_hex_to_rgb_parses_and_falls_back_to_white() -> None:
+    assert ui._hex_to_rgb("#00ffff") == (0, 255, 255)
+    assert ui._hex_to_rgb("0033FF") == (0, 51, 255)
+    assert ui._hex_to_rgb("#0033f") == (255, 255, 255)
+    assert ui._hex_to_rgb("#zz33ff") == (255, 255, 255)
+    assert ui._hex_to_rgb("#00 fff") == (255, 255, 255)
+
+
+def test_gateway_pane_is_reused_until_snapshot_changes() -> None:
+    ui_state = ui.UIState(view="gateway", modes=["general", "fast"])
+    state = ui.BackendState(gateway_traffic=["rx 1"])
+    pane = ui._gateway_pane(state, ui_state)
+    assert ui._gateway_pane(state, ui_state) is pane
+    ui_state.mode_index = 1
+    assert ui._gateway_pane(state, ui_state) is not pane
+    newer = ui.BackendState(gateway_traffic=["rx 2", "rx 1"])
+    assert ui._gateway_pane(newer, ui_state) is not ui._gateway_pane(state, ui_state)
+
+
+def test_gateway_body_shows_only_newest_traffic() -> None:
+    traffic = [f"line {i}" for i in range(30)]
+    state = ui.BackendState(gateway_traffic=traffic)
+    text = ui._render_gateway_body(state, ui.UIState(modes=["general"]))
+    shown = text.plain.split("Traffic:\n", 1)[1].splitlines()
+    assert shown == traffic[: ui.GATEWAY_TRAFFIC_LINES]
+
+
+def test_pin_console_size_stops_querying_the_terminal(monkeypatch) -> None:
+    import rich.console
+
+    console = ui.Console(file=io.StringIO())
+    terminal = ui.Console(file=io.StringIO(), width=132, height=40)
+    assert ui._pin_console_size(console, terminal) == (132, 40)
+
+    def fail(*_args):
+        raise AssertionError("pinned console should not query the terminal")
+
+    monkeypatch.setattr(rich.console.os, "get_terminal_size", fail)
+    assert console.size == (132, 40)
@@ -154,9 +154,9 @@ def test_requests_cleanup(web_browser):
                 request_id=f"req_{i}",
                 url=f"https://example{i}.com",
             )
-            req.status = "done"
             req.start_time = time.time() - (101 - i)  # Older requests have lower time
             web_browser._requests[f"req_{i}"] = req
+            web_browser._finish_request(req, "done")
     
     # Create a new request which should trigger cleanup
     with web_browser.app.test_client() as client:
@@ -170,6 +170,25 @@ def test_requests_cleanup(web_browser):
         assert len(web_browser._requests) < 101
 
 
+def test_requests_cleanup_keeps_in_flight_and_newest(web_browser):
+    """Test that cleanup drops the oldest finished requests and nothing in flight."""
+    with web_browser._request_lock:
+        for i in range(101):
+            req = BrowseRequest(request_id=f"req_{i}", url=f"https://example{i}.com")
+            web_browser._requests[f"req_{i}"] = req
+            if i % 10 == 0:
+                req.status = "sending"
+            else:
+                web_browser._finish_request(req, "done")
+        removed = web_browser._evict_finished_requests()
+        remaining = list(web_browser._requests)
+    assert len(remaining) == 50
+    assert removed == 51
+    assert all(f"req_{i}" in remaining for i in range(0, 101, 10))
+    assert "req_99" in remaining
+    assert "req_1" not in remaining
+
+
 def test_ensure_client_thread_safety(web_browser):
     """Test that _ensure_client is thread-safe."""
     clients = []
@@ -230,6 +249,48 @@ def test_index_route(web_browser):
         assert b'Meshtastic Web Browser' in response.data
 
 
+def test_index_follows_gateway_id_changes(web_browser):
+    """Test that the cached index page is re-rendered when the gateway ID changes."""
+    with web_browser.app.test_client() as client:
+        first = client.get('/').data
+        assert b'!test123' in first
+        assert client.get('/').data == first
+        web_browser.gateway_node_id = "!<new>"
+        updated = client.get('/').data
+        assert b'!&lt;new&gt;' in updated
+        assert b'!test123' not in updated
+
+
+def test_index_revalidates_with_etag(web_browser):
+    """Test that a matching If-None-Match gets an empty 304."""
+    with web_browser.app.test_client() as client:
+        response = client.get('/')
+        etag = response.headers["ETag"]
+        assert etag
+        cached = client.get('/', headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+        web_browser.gateway_node_id = "!other"
+        changed = client.get('/', headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+
+def test_index_serves_precompressed_gzip(web_browser):
+    """Test that gzip-capable clients get the pre-compressed page."""
+    import gzip
+
+    with web_browser.app.test_client() as client:
+        plain = client.get('/')
+        compressed = client.get('/', headers={"Accept-Encoding": "gzip, deflate"})
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert len(compressed.data) < len(plain.data)
+    assert gzip.decompress(compressed.data) == plain.data
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+
+
 def test_shutdown_closes_radio(web_browser):
     """Test that shutdown closes the radio connection."""
     # Create a mock radio
@@ -31,7 +31,7 @@ from logging_utils import configure_logging
 
 try:
     from .input_utils import prompt_custom_payload, prompt_for_payload, render_menu
-    from .setup_utils import build_transport, close_transport, start_gateway
+    from .setup_utils import MODEM_PRESETS, build_transport, close_transport, start_gateway
     from .command_presets import (
         COMMAND_PRESETS,
         apply_field_defaults,
@@ -55,7 +55,7 @@ try:
     )
 except ImportError:
     from input_utils import prompt_custom_payload, prompt_for_payload, render_menu
-    from setup_utils import build_transport, close_transport, start_gateway
+    from setup_utils import MODEM_PRESETS, build_transport, close_transport, start_gateway
     from command_presets import (
         COMMAND_PRESETS,
         apply_field_defaults,
@@ -83,23 +83,12 @@ def _apply_modem_preset(preset_name: str, gateway_port: str, client_port: str, s
         logging.info("Simulation enabled; skipping modem preset change (%s)", preset_name)
         return
     try:
-        from meshtastic import config_pb2, serial_interface
+        from meshtastic import serial_interface
     except ImportError as exc:  # pragma: no cover - hardware-only path
         logging.warning("meshtastic not available; cannot set modem preset %s: %s", preset_name, exc)
         return
 
-    preset_map = {
-        "LONG_FAST": config_pb2.Config.LoRaConfig.ModemPreset.LONG_FAST,
-        "LONG_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.LONG_SLOW,
-        "LONG_MODERATE": config_pb2.Config.LoRaConfig.ModemPreset.LONG_MODERATE,
-        "VERY_LONG_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.VERY_LONG_SLOW,
-        "MEDIUM_FAST": config_pb2.Config.LoRaConfig.ModemPreset.MEDIUM_FAST,
-        "MEDIUM_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.MEDIUM_SLOW,
-        "SHORT_FAST": config_pb2.Config.LoRaConfig.ModemPreset.SHORT_FAST,
-        "SHORT_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.SHORT_SLOW,
-        "SHORT_TURBO": config_pb2.Config.LoRaConfig.ModemPreset.SHORT_TURBO,
-    }
-    preset_value = preset_map.get(preset_name.upper())
+    preset_value = MODEM_PRESETS.get(preset_name.upper())
     if preset_value is None:
         logging.warning("Unknown modem preset %s; skipping preset change", preset_name)
         return
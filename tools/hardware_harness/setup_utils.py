@@ -18,6 +18,14 @@ from gateway import MeshtasticGateway
 from radio import build_radio
 from transport import MeshtasticTransport
 
+try:
+    from meshtastic import config_pb2 as _config_pb2
+except ImportError:  # pragma: no cover - hardware-only dependency
+    MODEM_PRESETS: dict[str, int] = {}
+else:
+    # Resolved once at import so applying a preset is a plain dict lookup.
+    MODEM_PRESETS = dict(_config_pb2.Config.LoRaConfig.ModemPreset.items())
+
 
 def build_transport(
     simulate: bool,
@@ -16,7 +16,7 @@ import signal
 import sys
 import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -24,17 +24,15 @@ from typing import Any, Dict, List, Optional
 
 def _ensure_imports() -> None:
     """Ensure src and hardware_harness are importable."""
-    root = Path(__file__).resolve()
-    while root != root.parent and not (root / "src").exists():
-        root = root.parent
-    
-    src = root / "src"
-    if src.exists() and str(src) not in sys.path:
-        sys.path.insert(0, str(src))
-    
-    harness = root / "tools" / "hardware_harness"
-    if harness.exists() and str(harness) not in sys.path:
-        sys.path.insert(0, str(harness))
+    for root in Path(__file__).resolve().parents:
+        src = root / "src"
+        if not src.exists():
+            continue
+        harness = root / "tools" / "hardware_harness"
+        for path in (src, harness):
+            if path.exists() and str(path) not in sys.path:
+                sys.path.insert(0, str(path))
+        break
 
 
 _ensure_imports()
@@ -42,7 +40,7 @@ _ensure_imports()
 from client import MeshtasticClient
 from logging_utils import configure_logging
 
-from setup_utils import build_transport, close_transport, start_gateway
+from setup_utils import MODEM_PRESETS, build_transport, close_transport, start_gateway
 from config_utils import (
     TRANSPORT_DEFAULTS,
     load_config,
@@ -61,7 +59,7 @@ from transport_helpers import (
 HARNESS_CONFIG_PATH = Path(__file__).resolve().parent.parent / "hardware_harness" / "config.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result from a single test scenario run."""
     scenario_name: str
@@ -77,16 +75,35 @@ class TestResult:
     throughput_kbps: float
     error: Optional[str] = None
     response_data: Optional[Dict[str, Any]] = None
+    override_lines: List[str] = field(default_factory=list)
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(slots=True)
 class TestScenario:
     """Configuration for a test scenario."""
     name: str
     description: str
     overrides: Dict[str, Any]
     payload_overrides: Dict[str, Any]
+    overrides_pretty: str = field(init=False, default="")
+    override_lines: List[str] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.overrides_pretty = json.dumps(self.overrides, indent=2)
+        self.override_lines = _override_lines(self.overrides)
+
+
+def _override_lines(overrides: Dict[str, Any]) -> List[str]:
+    """Flatten overrides into indented report lines (one level of nesting)."""
+    lines = []
+    for key, value in overrides.items():
+        if isinstance(value, dict):
+            for k, v in value.items():
+                lines.append(f"  {key}.{k}: {v}")
+        else:
+            lines.append(f"  {key}: {value}")
+    return lines
 
 
 def load_test_scenarios(path: str) -> tuple[List[TestScenario], str, Dict[str, Any]]:
@@ -137,38 +154,40 @@ def _apply_modem_preset(preset_name: str, gateway_port: str, client_port: str, s
         logging.info("Simulation enabled; skipping modem preset change (%s)", preset_name)
         return
     try:
-        from meshtastic import config_pb2, serial_interface
+        from meshtastic import serial_interface
     except ImportError as exc:
         logging.warning("meshtastic not available; cannot set modem preset %s: %s", preset_name, exc)
         return
 
-    preset_map = {
-        "LONG_FAST": config_pb2.Config.LoRaConfig.ModemPreset.LONG_FAST,
-        "LONG_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.LONG_SLOW,
-        "LONG_MODERATE": config_pb2.Config.LoRaConfig.ModemPreset.LONG_MODERATE,
-        "VERY_LONG_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.VERY_LONG_SLOW,
-        "MEDIUM_FAST": config_pb2.Config.LoRaConfig.ModemPreset.MEDIUM_FAST,
-        "MEDIUM_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.MEDIUM_SLOW,
-        "SHORT_FAST": config_pb2.Config.LoRaConfig.ModemPreset.SHORT_FAST,
-        "SHORT_SLOW": config_pb2.Config.LoRaConfig.ModemPreset.SHORT_SLOW,
-        "SHORT_TURBO": config_pb2.Config.LoRaConfig.ModemPreset.SHORT_TURBO,
-    }
-    preset_value = preset_map.get(preset_name.upper())
+    preset_value = MODEM_PRESETS.get(preset_name.upper())
     if preset_value is None:
         logging.warning("Unknown modem preset %s; skipping preset change", preset_name)
         return
 
     for name, port in (("gateway", gateway_port), ("client", client_port)):
+        iface = None
         try:
             iface = serial_interface.SerialInterface(port)
             cfg = iface.localNode.localConfig
             cfg.lora.modem_preset = preset_value
             iface.localNode.writeConfig("lora")
             logging.info("Set %s radio (%s) to preset %s", name, port, preset_name)
-            iface.close()
-            time.sleep(0.5)
         except Exception as exc:
             logging.warning("Failed to set preset %s on %s (%s): %s", preset_name, name, port, exc)
+        finally:
+            # writeConfig reboots the node, so this interface is stale either way;
+            # the transport opens a fresh one once the port settles.
+            if iface is not None:
+                try:
+                    iface.close()
+                except Exception as exc:
+                    logging.warning("Failed to close %s radio (%s): %s", name, port, exc)
+                time.sleep(0.5)
+
+
+def _json_size(data: Any) -> int:
+    """Compact JSON size in bytes; ensure_ascii output is 1 byte per character."""
+    return len(json.dumps(data, separators=(",", ":"), ensure_ascii=True))
 
 
 def run_single_test(
@@ -183,7 +202,7 @@ def run_single_test(
     Returns: (status, duration, request_bytes, response_bytes, error, response_data, response_id)
     """
     run_start = time.time()
-    request_bytes = len(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    request_bytes = _json_size(payload)
     response_bytes = 0
     error = None
     status = "error"
@@ -222,7 +241,7 @@ def run_single_test(
         if response is not None:
             response_data = response.to_dict()
             response_id = response_data.get("id")
-            response_bytes = len(json.dumps(response_data, separators=(",", ":")).encode("utf-8"))
+            response_bytes = _json_size(response_data)
             ack_spool_entry(client.transport, response.id)
             status = "success" if response.type == "response" else "error"
 
@@ -248,7 +267,7 @@ def run_scenario(
     print(f"\n{'='*60}")
     print(f"Running scenario: {scenario.name}")
     print(f"Description: {scenario.description}")
-    print(f"Overrides: {json.dumps(scenario.overrides, indent=2)}")
+    print(f"Overrides: {scenario.overrides_pretty}")
     print(f"{'='*60}\n")
 
     # Reset transport defaults to prevent cross-scenario state leakage
@@ -355,6 +374,7 @@ def run_scenario(
         throughput_kbps=throughput,
         error=error,
         response_data=resp_data,
+        override_lines=scenario.override_lines,
     )
 
 
@@ -367,32 +387,35 @@ def format_results(results: List[TestResult]) -> str:
     lines.append("=" * 70)
     lines.append("")
 
+    append = lines.append
+    extend = lines.extend
     for i, result in enumerate(results, 1):
-        lines.append(f"Test {i}: {result.scenario_name}")
-        lines.append("-" * 50)
-        lines.append(f"Description:    {result.description}")
-        lines.append(f"Command:        {result.command}")
-        lines.append(f"Status:         {result.status.upper()}")
-        lines.append(f"Duration:       {result.duration_seconds:.2f}s")
-        lines.append(f"Request size:   {_format_bytes(result.request_bytes)}")
-        lines.append(f"Response size:  {_format_bytes(result.response_bytes)}")
-        lines.append(f"Total payload:  {_format_bytes(result.request_bytes + result.response_bytes)}")
-        lines.append(f"Chunks sent:    {result.chunks_sent}")
-        lines.append(f"Throughput:     {result.throughput_kbps:.2f} kbps")
+        req_bytes = result.request_bytes
+        resp_bytes = result.response_bytes
+        overrides = result.overrides
+        error = result.error
+        extend((
+            f"Test {i}: {result.scenario_name}",
+            "-" * 50,
+            f"Description:    {result.description}",
+            f"Command:        {result.command}",
+            f"Status:         {result.status.upper()}",
+            f"Duration:       {result.duration_seconds:.2f}s",
+            f"Request size:   {_format_bytes(req_bytes)}",
+            f"Response size:  {_format_bytes(resp_bytes)}",
+            f"Total payload:  {_format_bytes(req_bytes + resp_bytes)}",
+            f"Chunks sent:    {result.chunks_sent}",
+            f"Throughput:     {result.throughput_kbps:.2f} kbps",
+        ))
         
-        if result.overrides:
-            lines.append("Overrides:")
-            for key, value in result.overrides.items():
-                if isinstance(value, dict):
-                    for k, v in value.items():
-                        lines.append(f"  {key}.{k}: {v}")
-                else:
-                    lines.append(f"  {key}: {value}")
+        if overrides:
+            append("Overrides:")
+            extend(result.override_lines or _override_lines(overrides))
         
-        if result.error:
-            lines.append(f"Error:          {result.error}")
+        if error:
+            append(f"Error:          {error}")
         
-        lines.append("")
+        append("")
 
     # Summary section
     lines.append("=" * 70)
@@ -614,11 +637,13 @@ def main() -> None:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     results_filename = f"test_results_{timestamp}.txt"
     results_path = results_dir / results_filename
+    snapshot_path = results_path.with_suffix(".jsonl")
 
     def write_results_snapshot() -> None:
-        report_text = format_results(results)
-        with open(results_path, "w", encoding="utf-8") as f:
-            f.write(report_text)
+        # Append only the newest result; the full text report is written once at the end.
+        with open(snapshot_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(results[-1])))
+            f.write("\n")
 
     for i, scenario in enumerate(selected_scenarios, 1):
         if stop_event.is_set():
@@ -659,6 +684,7 @@ def main() -> None:
                 chunks_sent=0,
                 throughput_kbps=0.0,
                 error=str(exc),
+                override_lines=scenario.override_lines,
             ))
             write_results_snapshot()
     
@@ -666,8 +692,10 @@ def main() -> None:
     if results:
         report = format_results(results)
         print("\n" + report)
-        with open(results_path, "w", encoding="utf-8") as f:
+        tmp_path = results_path.with_suffix(".txt.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             f.write(report)
+        os.replace(tmp_path, results_path)
         
         print(f"\nResults saved to: {results_path}")
 
@@ -7,7 +7,12 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # optional: only speeds up parsing large payloads
+    orjson = None
 
 
 def _ensure_src_imports() -> None:
@@ -21,6 +26,13 @@ def _ensure_src_imports() -> None:
         sys.path.insert(0, str(src))
 
 
+def _load_json(stream: IO[bytes]) -> Any:
+    """Parse JSON from a binary stream, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(stream.read())
+    return json.load(stream)
+
+
 def shorten_payload(data: Any) -> Any:
     _ensure_src_imports()
     from message import shorten_payload as _shorten
@@ -51,13 +63,12 @@ def main() -> None:
                 if line == "":
                     break
                 lines.append(line)
-            raw = "\n".join(lines)
+            data = json.loads("\n".join(lines))
         else:
-            raw = sys.stdin.read()
+            data = _load_json(sys.stdin.buffer)
     else:
-        with open(args.path, "r", encoding="utf-8") as f:
-            raw = f.read()
-    data = json.loads(raw)
+        with open(args.path, "rb") as f:
+            data = _load_json(f)
     shortened = shorten_payload(data)
     json.dump(shortened, sys.stdout, indent=2)
     sys.stdout.write("\n")
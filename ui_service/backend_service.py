@@ -2,31 +2,33 @@
 
 from __future__ import annotations
 
+import bisect
+import copy
+import functools
+import re
 import threading
 import time
 import base64
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from collections.abc import Iterable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Callable
 import json
+import os
 
-import sys
+from src_path import ensure_src_on_path
 
-ROOT = Path(__file__).resolve()
-while ROOT != ROOT.parent and not (ROOT / "src").exists():
-    ROOT = ROOT.parent
-SRC = ROOT / "src"
-if SRC.exists() and str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+ensure_src_on_path()
 
 from client import MeshtasticClient
-from dedupe import DedupeKeys, RequestDeduper
+from dedupe import RequestDeduper
 from gateway import MeshtasticGateway
 from message import MessageEnvelope
 from radio import build_radio
-from transport import MeshtasticTransport
+from spool import PersistentSpool
+from transport import MeshtasticTransport, RadioInterface
 
 __all__ = [
     "TransportWrapper",
@@ -37,8 +39,30 @@ __all__ = [
 
 
 class TransportWrapper:
-    """Wrapper for MeshtasticTransport that allows observing received messages."""
-    
+    """Wrapper for MeshtasticTransport that allows observing received messages.
+
+    Methods and attributes the gateway/client loops touch every iteration are
+    copied onto the instance so they never go through the ``__getattr__`` fallback.
+    The transport assigns all of them once in its constructor.
+    """
+
+    __slots__ = (
+        "_transport",
+        "_on_message",
+        "_on_send",
+        "tick",
+        "process_outbox",
+        "enqueue",
+        "should_process",
+        "build_dedupe_keys",
+        "last_chunk_progress",
+        "get_sent_chunk_count",
+        "deduper",
+        "spool",
+        "radio",
+        "segment_size",
+    )
+
     def __init__(
         self,
         transport: MeshtasticTransport,
@@ -48,6 +72,17 @@ class TransportWrapper:
         self._transport = transport
         self._on_message = on_message
         self._on_send = on_send
+        self.tick = transport.tick
+        self.process_outbox = transport.process_outbox
+        self.enqueue = transport.enqueue
+        self.should_process = transport.should_process
+        self.build_dedupe_keys = transport.build_dedupe_keys
+        self.last_chunk_progress = transport.last_chunk_progress
+        self.get_sent_chunk_count = transport.get_sent_chunk_count
+        self.deduper: RequestDeduper = transport.deduper
+        self.spool: PersistentSpool | None = transport.spool
+        self.radio: RadioInterface = transport.radio
+        self.segment_size: int = transport.segment_size
     
     def receive_message(self, timeout: float = 0.25) -> tuple[str | None, MessageEnvelope | None]:
         """Receive a message and notify observer if provided."""
@@ -66,26 +101,13 @@ class TransportWrapper:
             self._on_send()
         self._transport.send_message(envelope, destination, **kwargs)
     
-    def should_process(self, sender: str, envelope: MessageEnvelope) -> bool:
-        """Check if message should be processed."""
-        return self._transport.should_process(sender, envelope)
-    
-    def build_dedupe_keys(self, sender: str, envelope: MessageEnvelope) -> DedupeKeys:
-        """Build deduplication keys."""
-        return self._transport.build_dedupe_keys(sender, envelope)
-    
-    @property
-    def deduper(self) -> RequestDeduper:
-        """Access to deduper."""
-        return self._transport.deduper
-    
     def __getattr__(self, name: str):
-        """Forward all other attributes to wrapped transport."""
+        """Forward less common attributes to wrapped transport."""
         return getattr(self._transport, name)
 
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BackendState:
     radio_ports: list[str] = field(default_factory=list)
     accessible_ports: list[str] = field(default_factory=list)
@@ -134,37 +156,91 @@ def _normalize_ports(ports: Iterable[object]) -> list[str]:
     return normalized
 
 
-def detect_radio_ports() -> tuple[list[str], str | None]:
-    meshtastic_err = None
-    serial_err = None
-    ports: list[str] = []
-    try:
-        from meshtastic import util as meshtastic_util
+try:
+    from meshtastic import util as meshtastic_util
+except Exception as exc:  # pragma: no cover - depends on installed extras
+    meshtastic_util = None
+    _MESHTASTIC_IMPORT_ERROR: str | None = str(exc)
+else:
+    _MESHTASTIC_IMPORT_ERROR = None
 
-        ports = _normalize_ports(meshtastic_util.findPorts())
-    except Exception as exc:
-        meshtastic_err = str(exc)
-    try:
-        from serial.tools import list_ports
+try:
+    from serial.tools import list_ports
+except Exception as exc:  # pragma: no cover - depends on installed extras
+    list_ports = None
+    _SERIAL_IMPORT_ERROR: str | None = str(exc)
+else:
+    _SERIAL_IMPORT_ERROR = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Port scans stat the serial device tree; the backend polls every second, so reuse
+# a recent scan instead of rescanning each time.
+PORT_CACHE_TTL_SECONDS = 5.0
+_port_cache: tuple[float, list[str], str | None] | None = None  # (scanned_at, ports, error)
 
-        serial_ports = [port.device for port in list_ports.comports()]
-        for port in serial_ports:
-            if port not in ports:
-                ports.append(port)
-    except Exception as exc:
-        serial_err = str(exc)
 
+# Bluetooth serial and macOS console nodes show up in comports() but are never radios.
+_EXCLUDED_PORT_RE = re.compile(r"bluetooth|rfcomm|debug-console", re.IGNORECASE)
+
+
+def _scan_radio_ports() -> tuple[list[str], str | None]:
+    meshtastic_err = _MESHTASTIC_IMPORT_ERROR
+    serial_err = _SERIAL_IMPORT_ERROR
+    ports: list[str] = []
+    if meshtastic_util is not None:
+        try:
+            ports = _normalize_ports(meshtastic_util.findPorts())
+        except Exception as exc:
+            meshtastic_err = str(exc)
+    if list_ports is not None:
+        try:
+            serial_ports = [port.device for port in list_ports.comports()]
+            for port in serial_ports:
+                if port not in ports:
+                    ports.append(port)
+        except Exception as exc:
+            serial_err = str(exc)
+
+    ports = [port for port in ports if not _EXCLUDED_PORT_RE.search(port)]
     if not ports:
         return [], f"{meshtastic_err}; {serial_err}"
     return ports, None
 
 
+def detect_radio_ports(max_age: float = PORT_CACHE_TTL_SECONDS) -> tuple[list[str], str | None]:
+    """Return detected radio ports, reusing a scan younger than ``max_age`` seconds."""
+    global _port_cache
+    now = time.monotonic()
+    cached = _port_cache
+    if cached is not None and now - cached[0] < max_age:
+        return list(cached[1]), cached[2]
+    ports, error = _scan_radio_ports()
+    _port_cache = (now, ports, error)
+    return list(ports), error
+
+
+GATEWAY_LOG_SIZE = 30
+CLIENT_HISTORY_SIZE = 5
+SPOOL_DEPTH_INTERVAL_SECONDS = 0.1
+MAX_POLL_INTERVAL_SECONDS = 10.0
+
+
 class BackendService:
     def __init__(self, poll_interval: float = 1.0) -> None:
         self._poll_interval = poll_interval
+        # Published state: readers load the reference without locking; writers
+        # take the lock only to swap in a new instance built with replace().
         self._state = BackendState()
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        # Wakes the poll loop early (stop, or a port change that needs a reconnect).
+        self._wake_event = threading.Event()
+        # Consecutive polls with an unchanged port set and no radio error.
+        self._stable_polls = 0
         self._thread = threading.Thread(
             target=self._run,
             daemon=True,
@@ -173,70 +249,78 @@ class BackendService:
         self._gateway_thread: threading.Thread | None = None
         self._gateway_stop_event = threading.Event()
         self._client_thread: threading.Thread | None = None
-        self._gateway_log = deque(maxlen=30)
-        self._connected_radios: set[str] = set()
+        # Fixed-size ring of gateway log lines. Writers only store into it; the
+        # newest-first list is built in snapshot(), once per burst of events.
+        self._gateway_log: list[str] = [""] * GATEWAY_LOG_SIZE
+        self._gateway_head = 0
+        self._published_gateway_head = 0
+        self._client_history: deque[str] = deque(maxlen=CLIENT_HISTORY_SIZE)
+        # Kept sorted as radios are first seen; a copy is published as connected_radios
+        # only when membership changes.
+        self._connected_radios: list[str] = []
         self._radio: object | None = None
         self._transport: MeshtasticTransport | None = None
         self._radio_port: str | None = None
         self._radio_error: str | None = None
-        self._last_connect_attempt = 0.0
+        # Resolved once per connection; the local node ID doesn't change while connected.
+        self._local_radio_id: str | None = None
+        self._last_spool_depth = 0
+        self._last_spool_update = float("-inf")
+        # Interval bookkeeping uses time.monotonic(); time.time() is only for
+        # the wall-clock last_rx_time/last_tx_time shown in the UI.
+        self._last_connect_attempt = float("-inf")
         self._preferred_port: str | None = None
         self._mode_name: str = "general"
         self._mode_config: dict = _load_mode_config(self._mode_name)
-        # Cache for port accessibility probing to avoid expensive I/O on every poll.
-        # TTL of 30 seconds balances responsiveness with performance - allows detecting
-        # new ports within reasonable time while avoiding excessive serial port probing.
-        self._last_ports: list[str] = []
+        # Cache for port accessibility probing. The probe is an OS-level open/lock,
+        # so it is cheap enough to refresh at the same cadence as the port scan.
+        # Order-insensitive: findPorts() and comports() may list the same devices
+        # in a different order between scans.
+        self._last_ports: frozenset[str] | None = None
         self._last_accessible: list[str] = []
-        self._last_probe_time: float = 0.0
-        self._probe_ttl_seconds: float = 30.0
+        self._last_probe_time = float("-inf")
+        self._probe_ttl_seconds: float = PORT_CACHE_TTL_SECONDS
+        # Ports are probed concurrently so one slow device doesn't stall the poll loop.
+        self._probe_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="port-probe")
 
     def start(self) -> None:
         self._thread.start()
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wake_event.set()
         self._thread.join(timeout=2.0)
         self.stop_gateway()
         if self._client_thread and self._client_thread.is_alive():
             self._client_thread.join(timeout=2.0)
         self._close_radio()
+        self._probe_pool.shutdown(wait=False, cancel_futures=True)
 
     def snapshot(self) -> BackendState:
+        """Return the current state; it is frozen and never mutated after publication."""
+        if self._published_gateway_head != self._gateway_head:
+            with self._lock:
+                head = self._gateway_head
+                if self._published_gateway_head != head:
+                    traffic = self._gateway_traffic(head)
+                    self._state = replace(self._state, gateway_traffic=traffic)
+                    self._published_gateway_head = head
+        return self._state
+
+    def _gateway_traffic(self, head: int) -> list[str]:
+        log = self._gateway_log
+        oldest = max(head - GATEWAY_LOG_SIZE, 0)
+        # Newest first; every slot in [oldest, head) has been written.
+        return [log[i % GATEWAY_LOG_SIZE] for i in range(head - 1, oldest - 1, -1)]
+
+    def _update_state(self, **changes: object) -> None:
+        """Publish all ``changes`` in one replace(); skip it if nothing differs."""
         with self._lock:
-            return BackendState(
-                radio_ports=list(self._state.radio_ports),
-                accessible_ports=list(self._state.accessible_ports),
-                radio_detected=self._state.radio_detected,
-                last_error=self._state.last_error,
-                mode=self._state.mode,
-                local_radio_id=self._state.local_radio_id,
-                connected_radios=list(self._state.connected_radios),
-                gateway_traffic=list(self._state.gateway_traffic),
-                gateway_error=self._state.gateway_error,
-                client_gateway_id=self._state.client_gateway_id,
-                client_url=self._state.client_url,
-                client_status=self._state.client_status,
-                client_response=self._state.client_response,
-                client_error=self._state.client_error,
-                client_send_chunks_sent=self._state.client_send_chunks_sent,
-                client_send_chunks_total=self._state.client_send_chunks_total,
-                client_send_eta_seconds=self._state.client_send_eta_seconds,
-                client_recv_chunks_received=self._state.client_recv_chunks_received,
-                client_recv_chunks_total=self._state.client_recv_chunks_total,
-                client_recv_eta_seconds=self._state.client_recv_eta_seconds,
-                client_last_payload=self._state.client_last_payload,
-                client_last_payload_raw=self._state.client_last_payload_raw,
-                client_last_payload_decoded=self._state.client_last_payload_decoded,
-                gateway_last_payload=self._state.gateway_last_payload,
-                gateway_last_payload_raw=self._state.gateway_last_payload_raw,
-                gateway_last_payload_decoded=self._state.gateway_last_payload_decoded,
-                gateway_last_chunks_total=self._state.gateway_last_chunks_total,
-                last_rx_time=self._state.last_rx_time,
-                last_tx_time=self._state.last_tx_time,
-                spool_depth=self._state.spool_depth,
-                client_history=list(self._state.client_history),
-            )
+            state = self._state
+            for name, value in changes.items():
+                if getattr(state, name) != value:
+                    self._state = replace(state, **changes)
+                    return
 
     def _run(self) -> None:
         while not self._stop_event.is_set():
@@ -245,47 +329,72 @@ class BackendService:
             
             # Cache for port accessibility probing to avoid expensive I/O on every poll.
             # Re-probe ports only if the list of ports has changed or the cache is stale.
-            now = time.time()
-            if ports != self._last_ports or (now - self._last_probe_time) >= self._probe_ttl_seconds:
-                accessible: list[str] = []
-                for port in ports:
-                    if self._radio_port and port == self._radio_port:
-                        accessible.append(port)
-                        continue
-                    ok, _ = _probe_port_accessibility(port)
-                    if ok:
-                        accessible.append(port)
-                self._last_ports = list(ports)
-                self._last_accessible = list(accessible)
+            now = time.monotonic()
+            port_set = frozenset(ports)
+            if port_set == self._last_ports and not self._radio_error:
+                self._stable_polls = min(self._stable_polls + 1, 16)
+            else:
+                self._stable_polls = 0
+            if (
+                port_set != self._last_ports
+                or (now - self._last_probe_time) >= self._probe_ttl_seconds
+            ):
+                accessible = self._probe_ports(ports)
+                self._last_ports = port_set
+                self._last_accessible = accessible
                 self._last_probe_time = now
             else:
                 # Use cached accessibility results when ports are unchanged and cache is fresh.
-                accessible = list(self._last_accessible)
+                # Published lists are never mutated, so the cached list can be shared.
+                accessible = self._last_accessible
             
             # Always include the current radio port if connected
             if self._radio_port and self._radio_port not in accessible:
-                accessible.append(self._radio_port)
-            with self._lock:
-                if self._radio:
-                    self._state.radio_ports = [self._radio_port] if self._radio_port else []
-                    self._state.radio_detected = True
-                    self._state.last_error = None
-                else:
-                    self._state.radio_ports = []
-                    self._state.radio_detected = False
-                    self._state.last_error = self._radio_error or error
-                self._state.accessible_ports = accessible
-            self._stop_event.wait(self._poll_interval)
+                accessible = [*accessible, self._radio_port]
+            if self._radio:
+                self._update_state(
+                    radio_ports=[self._radio_port] if self._radio_port else [],
+                    radio_detected=True,
+                    last_error=None,
+                    accessible_ports=accessible,
+                )
+            else:
+                self._update_state(
+                    radio_ports=[],
+                    radio_detected=False,
+                    last_error=self._radio_error or error,
+                    accessible_ports=accessible,
+                )
+            self._wake_event.wait(self._next_poll_delay())
+            self._wake_event.clear()
+
+    def _next_poll_delay(self) -> float:
+        """Poll quickly while looking for a radio; once connected, sleep until the port
+        scan expires, backing off further while the port set stays unchanged."""
+        if self._radio is None:
+            return self._poll_interval
+        base = max(self._poll_interval, PORT_CACHE_TTL_SECONDS)
+        return min(base * 1.5**self._stable_polls, max(base, MAX_POLL_INTERVAL_SECONDS))
+
+    def _wake(self) -> None:
+        """Re-poll now and drop any idle back-off (user action)."""
+        self._stable_polls = 0
+        self._wake_event.set()
 
     def start_gateway(self) -> None:
         with self._lock:
-            self._state.mode = "gateway"
-            self._state.gateway_error = None
-            self._state.local_radio_id = None
             self._connected_radios.clear()
-            self._gateway_log.clear()
-            self._state.connected_radios = []
-            self._state.gateway_traffic = []
+            self._gateway_head = 0
+            self._published_gateway_head = 0
+            self._state = replace(
+                self._state,
+                mode="gateway",
+                gateway_error=None,
+                local_radio_id=None,
+                connected_radios=[],
+                gateway_traffic=[],
+            )
+        self._wake()
         if self._gateway_thread and self._gateway_thread.is_alive():
             return
         self._gateway_stop_event.clear()
@@ -302,24 +411,25 @@ class BackendService:
             self._gateway_thread.join(timeout=2.0)
         with self._lock:
             if self._state.mode == "gateway":
-                self._state.mode = "idle"
+                self._state = replace(self._state, mode="idle")
 
     def send_http_request(self, gateway_id: str, url: str) -> None:
-        with self._lock:
-            self._state.mode = "client"
-            self._state.client_gateway_id = gateway_id
-            self._state.client_url = url
-            self._state.client_status = "sending"
-            self._state.client_response = None
-            self._state.client_error = None
-            self._state.client_send_chunks_sent = 0
-            self._state.client_send_chunks_total = 0
-            self._state.client_send_eta_seconds = None
-            self._state.client_recv_chunks_received = 0
-            self._state.client_recv_chunks_total = 0
-            self._state.client_recv_eta_seconds = None
-            self._state.client_last_payload = None
-            self._state.client_history = list(self._state.client_history)
+        self._update_state(
+            mode="client",
+            client_gateway_id=gateway_id,
+            client_url=url,
+            client_status="sending",
+            client_response=None,
+            client_error=None,
+            client_send_chunks_sent=0,
+            client_send_chunks_total=0,
+            client_send_eta_seconds=None,
+            client_recv_chunks_received=0,
+            client_recv_chunks_total=0,
+            client_recv_eta_seconds=None,
+            client_last_payload=None,
+        )
+        self._wake()
         if self._client_thread and self._client_thread.is_alive():
             return
         self._client_thread = threading.Thread(
@@ -331,12 +441,14 @@ class BackendService:
         self._client_thread.start()
 
     def send_health_request(self, gateway_id: str) -> None:
-        with self._lock:
-            self._state.mode = "client"
-            self._state.client_gateway_id = gateway_id
-            self._state.client_status = "sending"
-            self._state.client_response = None
-            self._state.client_error = None
+        self._update_state(
+            mode="client",
+            client_gateway_id=gateway_id,
+            client_status="sending",
+            client_response=None,
+            client_error=None,
+        )
+        self._wake()
         if self._client_thread and self._client_thread.is_alive():
             return
         self._client_thread = threading.Thread(
@@ -363,6 +475,7 @@ class BackendService:
         self.stop_gateway()
         self._close_radio()
         self._preferred_port = port
+        self._wake()
 
     def list_accessible_ports(self) -> list[str]:
         snapshot = self.snapshot()
@@ -374,47 +487,77 @@ class BackendService:
             return accessible
         # Fallback probe if nothing cached
         ports, _ = detect_radio_ports()
+        return self._probe_ports(ports)
+
+    def _probe_ports(self, ports: list[str]) -> list[str]:
+        """Return the accessible ports, in scan order, probing candidates in parallel."""
+        radio_port = self._radio_port
+        futures = {
+            port: self._probe_pool.submit(_probe_port_accessibility, port)
+            for port in ports
+            if port != radio_port and _is_probe_candidate(port)
+        }
+        accessible: list[str] = []
         for port in ports:
-            ok, _ = _probe_port_accessibility(port)
+            if radio_port and port == radio_port:
+                accessible.append(port)
+                continue
+            future = futures.get(port)
+            if future is None:
+                continue
+            try:
+                ok, _ = future.result(timeout=1.0)
+            except Exception:
+                continue
             if ok:
                 accessible.append(port)
         return accessible
 
     def _run_gateway(self) -> None:
+        # UI bookkeeping for received messages runs on its own worker so formatting
+        # payloads for display never delays the gateway's radio loop.
+        observer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gateway-observer")
+
+        def on_message(
+            sender: str, envelope: MessageEnvelope, progress: dict[str, int] | None
+        ) -> None:
+            observer.submit(self._record_gateway_event, sender, envelope, progress)
+
         try:
             transport = self._transport
             if transport is None:
-                with self._lock:
-                    self._state.gateway_error = self._radio_error or "no accessible radios"
+                self._update_state(gateway_error=self._radio_error or "no accessible radios")
                 return
             
             # Wrap transport to observe messages
             wrapped_transport = TransportWrapper(
                 transport,
-                on_message=self._record_gateway_event,
+                on_message=on_message,
                 on_send=self._record_tx_event,
             )
             gateway = MeshtasticGateway(wrapped_transport)
             
-            local_id = _resolve_local_radio_id(self._radio)
-            with self._lock:
-                self._state.local_radio_id = local_id
-                if self._radio_port:
-                    self._state.radio_ports = [self._radio_port]
+            local_id = self._local_radio_id or _resolve_local_radio_id(self._radio)
+            if self._radio_port:
+                self._update_state(local_radio_id=local_id, radio_ports=[self._radio_port])
+            else:
+                self._update_state(local_radio_id=local_id)
             
             while not self._gateway_stop_event.is_set():
                 gateway.run_once(timeout=0.25)
         except Exception as exc:
-            with self._lock:
-                self._state.gateway_error = str(exc)
+            self._update_state(gateway_error=str(exc))
+        finally:
+            observer.shutdown(wait=False)
 
     def _run_client_request(self, gateway_id: str, url: str) -> None:
         try:
             transport = self._transport
             if transport is None:
-                with self._lock:
-                    self._state.client_status = "error"
-                    self._state.client_error = self._radio_error or "no accessible radios"
+                self._update_state(
+                    client_status="error",
+                    client_error=self._radio_error or "no accessible radios",
+                )
                 return
             wrapped_transport = TransportWrapper(
                 transport,
@@ -426,52 +569,55 @@ class BackendService:
                 progress_callback=self._record_client_progress,
             )
             summary = _summarize_response(response)
-            with self._lock:
-                self._state.client_status = "done"
-                self._state.client_response = summary
-                self._state.client_last_payload = _format_payload(response.data)
-                self._state.client_last_payload_raw = _stringify_payload(response.data)
-                self._state.client_last_payload_decoded = _decode_content(response.data)
-                self._state.client_history = _append_history(
-                    self._state.client_history,
-                    f"{_timestamp()} http_request {summary}",
-                )
+            self._record_client_response(
+                response, summary, f"{_timestamp()} http_request {summary}"
+            )
         except Exception as exc:
-            with self._lock:
-                self._state.client_status = "error"
-                self._state.client_error = str(exc)
+            self._update_state(client_status="error", client_error=str(exc))
 
     def _run_health_request(self, gateway_id: str) -> None:
         try:
             transport = self._transport
             if transport is None:
-                with self._lock:
-                    self._state.client_status = "error"
-                    self._state.client_error = self._radio_error or "no accessible radios"
+                self._update_state(
+                    client_status="error",
+                    client_error=self._radio_error or "no accessible radios",
+                )
                 return
             wrapped_transport = TransportWrapper(
                 transport,
                 on_send=self._record_tx_event,
             )
             client = MeshtasticClient(wrapped_transport, gateway_id)
-            start = time.time()
+            start = time.monotonic()
             response = client.send_request("health")
-            latency = (time.time() - start) * 1000.0
+            latency = (time.monotonic() - start) * 1000.0
             summary = _summarize_response(response)
-            with self._lock:
-                self._state.client_status = "done"
-                self._state.client_response = f"{summary} ({latency:.0f} ms)"
-                self._state.client_last_payload = _format_payload(response.data)
-                self._state.client_last_payload_raw = _stringify_payload(response.data)
-                self._state.client_last_payload_decoded = _decode_content(response.data)
-                self._state.client_history = _append_history(
-                    self._state.client_history,
-                    f"{_timestamp()} health {summary} ({latency:.0f} ms)",
-                )
+            self._record_client_response(
+                response,
+                f"{summary} ({latency:.0f} ms)",
+                f"{_timestamp()} health {summary} ({latency:.0f} ms)",
+            )
         except Exception as exc:
-            with self._lock:
-                self._state.client_status = "error"
-                self._state.client_error = str(exc)
+            self._update_state(client_status="error", client_error=str(exc))
+
+    def _record_client_response(
+        self, response: MessageEnvelope, summary: str, history_entry: str
+    ) -> None:
+        # Stringify/base64-decode before taking the lock; it only covers the swap.
+        payload, payload_raw, payload_decoded = _render_payload(response.data)
+        with self._lock:
+            self._client_history.appendleft(history_entry)
+            self._state = replace(
+                self._state,
+                client_status="done",
+                client_response=summary,
+                client_last_payload=payload,
+                client_last_payload_raw=payload_raw,
+                client_last_payload_decoded=payload_decoded,
+                client_history=list(self._client_history),
+            )
+
     def _record_gateway_event(
         self,
         sender: str,
@@ -487,44 +633,68 @@ class BackendService:
                 url = str(envelope.data.get("url") or "")
             if url:
                 message = f"{timestamp} {sender} {command} {url}"
+        # Stringify/base64-decode before taking the lock; it only covers the swap.
+        payload, payload_raw, payload_decoded = _render_payload(envelope.data)
+        changes: dict[str, object] = {
+            "gateway_last_payload": payload,
+            "gateway_last_payload_raw": payload_raw,
+            "gateway_last_payload_decoded": payload_decoded,
+            "last_rx_time": time.time(),
+            "spool_depth": self._spool_depth(),
+        }
+        if progress and progress.get("total"):
+            changes["gateway_last_chunks_total"] = int(progress["total"])
         with self._lock:
-            self._connected_radios.add(sender)
-            self._gateway_log.appendleft(message)
-            self._state.connected_radios = sorted(self._connected_radios)
-            self._state.gateway_traffic = list(self._gateway_log)
-            self._state.gateway_last_payload = _format_payload(envelope.data)
-            self._state.gateway_last_payload_raw = _stringify_payload(envelope.data)
-            self._state.gateway_last_payload_decoded = _decode_content(envelope.data)
-            if progress and progress.get("total"):
-                self._state.gateway_last_chunks_total = int(progress["total"])
-            self._state.last_rx_time = time.time()
-            self._state.spool_depth = _get_spool_depth(self._transport)
+            radios = self._connected_radios
+            idx = bisect.bisect_left(radios, sender)
+            if idx == len(radios) or radios[idx] != sender:
+                radios.insert(idx, sender)
+                # Published lists are never mutated, so hand readers a copy.
+                changes["connected_radios"] = list(radios)
+            self._gateway_log[self._gateway_head % GATEWAY_LOG_SIZE] = message
+            self._gateway_head += 1
+            self._state = replace(self._state, **changes)
 
     def _record_client_progress(self, update: dict[str, object]) -> None:
         phase = str(update.get("phase", ""))
-        with self._lock:
-            if phase == "send":
-                self._state.client_send_chunks_sent = int(update.get("sent_chunks", 0))
-                self._state.client_send_chunks_total = int(update.get("total_chunks", 0))
-                self._state.client_send_eta_seconds = _coerce_seconds(update.get("eta_seconds"))
-            elif phase == "receive":
-                self._state.client_recv_chunks_received = int(
-                    update.get("received_chunks", 0)
-                )
-                self._state.client_recv_chunks_total = int(update.get("total_chunks", 0))
-                self._state.client_recv_eta_seconds = _coerce_seconds(update.get("eta_seconds"))
-                self._state.last_rx_time = time.time()
-            self._state.spool_depth = _get_spool_depth(self._transport)
+        spool_depth = self._spool_depth()
+        if phase == "send":
+            self._update_state(
+                client_send_chunks_sent=int(update.get("sent_chunks", 0)),
+                client_send_chunks_total=int(update.get("total_chunks", 0)),
+                client_send_eta_seconds=_coerce_seconds(update.get("eta_seconds")),
+                spool_depth=spool_depth,
+            )
+        elif phase == "receive":
+            self._update_state(
+                client_recv_chunks_received=int(update.get("received_chunks", 0)),
+                client_recv_chunks_total=int(update.get("total_chunks", 0)),
+                client_recv_eta_seconds=_coerce_seconds(update.get("eta_seconds")),
+                last_rx_time=time.time(),
+                spool_depth=spool_depth,
+            )
+        else:
+            self._update_state(spool_depth=spool_depth)
 
     def _record_tx_event(self) -> None:
-        with self._lock:
-            self._state.last_tx_time = time.time()
-            self._state.spool_depth = _get_spool_depth(self._transport)
+        self._update_state(last_tx_time=time.time(), spool_depth=self._spool_depth())
+
+    def _spool_depth(self) -> int:
+        """Spool depth, re-read at most every SPOOL_DEPTH_INTERVAL_SECONDS.
+
+        TX/RX/progress callbacks fire many times per second during a chunked
+        transfer, but the UI only renders a few times per second.
+        """
+        now = time.monotonic()
+        if now - self._last_spool_update > SPOOL_DEPTH_INTERVAL_SECONDS:
+            self._last_spool_depth = _get_spool_depth(self._transport)
+            self._last_spool_update = now
+        return self._last_spool_depth
 
     def _ensure_radio_connection(self, ports: list[str], error: str | None) -> None:
         if self._radio:
             return
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_connect_attempt < 2.0:
             return
         self._last_connect_attempt = now
@@ -541,8 +711,8 @@ class BackendService:
             self._transport = self._build_transport(radio)
             self._radio_port = used_port
             self._radio_error = None
-            with self._lock:
-                self._state.local_radio_id = _resolve_local_radio_id(radio)
+            self._local_radio_id = _resolve_local_radio_id(radio)
+            self._update_state(local_radio_id=self._local_radio_id)
         except Exception as exc:
             self._radio_error = str(exc)
 
@@ -551,10 +721,10 @@ class BackendService:
         self._radio = None
         self._transport = None
         self._radio_port = None
+        self._local_radio_id = None
         if radio and hasattr(radio, "close"):
             radio.close()
-        with self._lock:
-            self._state.local_radio_id = None
+        self._update_state(local_radio_id=None)
 
     def _rebuild_transport(self) -> None:
         if not self._radio:
@@ -581,32 +751,65 @@ class BackendService:
 
 
 def _resolve_local_radio_id(radio: object) -> str | None:
-    if hasattr(radio, "node_id"):
-        return str(getattr(radio, "node_id"))
-    interface = getattr(radio, "_interface", None)
-    if interface and hasattr(interface, "getMyNodeInfo"):
-        info = interface.getMyNodeInfo()
-        if isinstance(info, dict):
-            user = info.get("user", {})
-            if isinstance(user, dict) and user.get("id"):
-                return str(user.get("id"))
+    try:
+        return str(radio.node_id)  # type: ignore[attr-defined]
+    except AttributeError:
+        pass
+    get_info = getattr(getattr(radio, "_interface", None), "getMyNodeInfo", None)
+    if get_info is None:
+        return None
+    info = get_info()
+    if isinstance(info, dict):
+        user = info.get("user")
+        if isinstance(user, dict) and user.get("id"):
+            return str(user["id"])
     return None
 
 
+# USB serial adapters and native USB CDC devices; skips Bluetooth, modem and
+# onboard UART nodes that can never be a Meshtastic radio.
+_PROBE_PORT_RE = re.compile(
+    r"^(?:/dev/(?:ttyUSB|ttyACM|cu\.usbserial|cu\.usbmodem|cu\.wchusbserial|cu\.SLAB_USBtoUART)\S*|COM\d+)$"
+)
+
+
+def _is_probe_candidate(port: str) -> bool:
+    return _PROBE_PORT_RE.match(port) is not None
+
+
 def _probe_port_accessibility(port: str) -> tuple[bool, str | None]:
-    """Try opening a radio on the given port to verify accessibility."""
-    radio = None
+    """Check that the port can be opened exclusively, without speaking the Meshtastic protocol."""
+    if os.name == "nt":
+        return _probe_windows_port(port)
     try:
-        radio = build_radio(False, port, "probe")
+        fd = os.open(port, os.O_RDWR | os.O_NONBLOCK | os.O_NOCTTY)
+    except OSError as exc:
+        return False, str(exc)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
         return True, None
-    except Exception as exc:
+    except OSError as exc:
         return False, str(exc)
     finally:
-        if radio and hasattr(radio, "close"):
-            try:
-                radio.close()
-            except Exception:
-                pass
+        os.close(fd)
+
+
+def _probe_windows_port(port: str) -> tuple[bool, str | None]:  # pragma: no cover - Windows only
+    import ctypes
+
+    generic_read_write = 0x80000000 | 0x40000000
+    open_existing = 3
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateFileW.restype = ctypes.c_void_p
+    handle = kernel32.CreateFileW(
+        "\\\\.\\" + port, generic_read_write, 0, None, open_existing, 0, None
+    )
+    if handle is None or handle == ctypes.c_void_p(-1).value:
+        return False, ctypes.FormatError(ctypes.get_last_error())
+    kernel32.CloseHandle(ctypes.c_void_p(handle))
+    return True, None
 
 
 def _open_radio_from_ports(
@@ -640,13 +843,16 @@ def _summarize_response(response: MessageEnvelope) -> str:
     return "response received"
 
 
-def _format_payload(payload: object, limit: int = 160) -> str | None:
+def _render_payload(payload: object, limit: int = 160) -> tuple[str | None, str, str | None]:
+    """Return the (truncated, raw, decoded content) views of a payload in one pass."""
+    raw = _stringify_payload(payload)
     if payload is None:
-        return None
-    text = _stringify_payload(payload)
-    if len(text) > limit:
-        return text[: limit - 3] + "..."
-    return text
+        formatted = None
+    elif len(raw) > limit:
+        formatted = raw[: limit - 3] + "..."
+    else:
+        formatted = raw
+    return formatted, raw, _decode_content(payload)
 
 
 def _stringify_payload(payload: object) -> str:
@@ -656,21 +862,27 @@ def _stringify_payload(payload: object) -> str:
         return str(payload)
 
 
+_b64decode = base64.b64decode
+
+
 def _decode_content(payload: object) -> str | None:
+    if not isinstance(payload, dict):
+        return None
+    b64 = payload.get("content_b64")
+    if not b64:
+        result = payload.get("result")
+        if isinstance(result, dict):
+            b64 = result.get("content_b64")
+    if not isinstance(b64, str):
+        return None
     try:
-        if isinstance(payload, dict):
-            b64 = payload.get("content_b64")
-            if not b64 and isinstance(payload.get("result"), dict):
-                b64 = payload["result"].get("content_b64")
-            if isinstance(b64, str):
-                raw = base64.b64decode(b64)
-                try:
-                    return raw.decode("utf-8")
-                except UnicodeDecodeError:
-                    return raw.hex()
-    except Exception:
+        raw = _b64decode(b64)
+    except ValueError:  # binascii.Error, or non-ASCII input
         return None
-    return None
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.hex()
 
 
 def _coerce_seconds(value: object) -> float | None:
@@ -682,13 +894,20 @@ def _coerce_seconds(value: object) -> float | None:
         return None
 
 
-def _append_history(history: list[str], entry: str, limit: int = 5) -> list[str]:
-    updated = [entry] + history
-    return updated[:limit]
+# (epoch second, formatted) - gateway bursts log many lines within the same second.
+# A race between threads only means formatting the same second twice.
+_TS_CACHE: tuple[int, str] = (0, "")
 
 
 def _timestamp() -> str:
-    return time.strftime("%H:%M:%S")
+    global _TS_CACHE
+    now = int(time.time())
+    cached_second, cached_text = _TS_CACHE
+    if now == cached_second:
+        return cached_text
+    text = time.strftime("%H:%M:%S", time.localtime(now))
+    _TS_CACHE = (now, text)
+    return text
 
 
 def _get_spool_depth(transport: MeshtasticTransport | None) -> int:
@@ -700,11 +919,24 @@ def _get_spool_depth(transport: MeshtasticTransport | None) -> int:
     return 0
 
 
+MODES_DIR = Path(__file__).resolve().parent.parent / "modes"
+
+
 def _load_mode_config(mode_name: str) -> dict:
-    root = Path(__file__).resolve().parent.parent
-    mode_path = root / "modes" / f"{mode_name}.json"
+    mode_path = MODES_DIR / f"{mode_name}.json"
+    try:
+        mtime = os.stat(mode_path).st_mtime_ns
+    except OSError:
+        return {}
+    # Callers may mutate the config; never hand out the cached dict itself.
+    return copy.deepcopy(_read_mode_config(str(mode_path), mtime))
+
+
+@functools.lru_cache(maxsize=16)
+def _read_mode_config(path: str, mtime_ns: int) -> dict:
+    """Parse a mode file; keyed on mtime so edits on disk are picked up."""
     try:
-        with open(mode_path, "r", encoding="utf-8") as handle:
+        with open(path, "r", encoding="utf-8") as handle:
             return json.load(handle)
     except Exception:
         return {}
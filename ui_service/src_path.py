@@ -0,0 +1,28 @@
+"""Locate the bridge ``src/`` directory for the UI service's flat imports."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+__all__ = ["ROOT", "SRC", "ensure_src_on_path"]
+
+
+def _locate_src() -> Path:
+    # MESHTASTIC_BRIDGE_SRC points at src/ directly and skips the directory walk.
+    override = os.environ.get("MESHTASTIC_BRIDGE_SRC")
+    if override:
+        return Path(override)
+    here = Path(__file__).resolve().parent
+    root = next((p for p in (here, *here.parents) if (p / "src").is_dir()), here.parent)
+    return root / "src"
+
+
+SRC = _locate_src()
+ROOT = SRC.parent
+
+
+def ensure_src_on_path() -> None:
+    if SRC.exists() and str(SRC) not in sys.path:
+        sys.path.insert(0, str(SRC))
@@ -2,23 +2,28 @@
 
 from __future__ import annotations
 
+import codecs
+import functools
 import json
 import logging
 import os
-import queue
+import signal
 import sys
 import threading
 import time
 import textwrap
-import glob
+from collections import deque
 from pathlib import Path
 from dataclasses import dataclass
-from rich.console import Console
+from rich.console import Console, ConsoleDimensions, ConsoleOptions, RenderableType, RenderResult
 from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
+from rich.color import Color
 from rich.layout import Layout
 from rich.live import Live
+from rich.measure import Measurement
+from rich.segment import Segment
 from rich.style import Style
 
 from backend_service import BackendService, BackendState
@@ -38,8 +43,24 @@ MESHTASTIC_LOGO = """
 BRIDGE_SUBTITLE = "Meshbridge"
 BRIDGE_VERSION = "unknown"
 
+# Styles used by the body and footer text, parsed once instead of per span.
+STYLE_HEADING = Style.parse("bold cyan")
+STYLE_KEY = Style.parse("bold white")
+STYLE_DIM = Style.parse("dim")
+STYLE_OK = Style.parse("green")
+STYLE_LINK = Style.parse("bold green underline")
+STYLE_ERROR = Style.parse("red")
+STYLE_ERROR_HEADING = Style.parse("bold red")
+STYLE_WARNING = Style.parse("yellow")
+STYLE_DISABLED = Style.parse("grey50")
+
 
 def _load_version() -> str:
+    # The meshbridge launcher passes the package version; package.json is only
+    # read when ui.py is started directly from a checkout.
+    version = os.environ.get("MESHTASTIC_BRIDGE_VERSION")
+    if version:
+        return version
     root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     package_path = os.path.join(root, "package.json")
     try:
@@ -51,17 +72,27 @@ def _load_version() -> str:
         return "unknown"
 
 
+MODES_DIR = Path(__file__).resolve().parent.parent / "modes"
+_modes_cache: tuple[int, list[str]] | None = None  # (modes dir mtime_ns, names)
+
+
 def _load_modes() -> list[str]:
-    root = Path(__file__).resolve().parent.parent
-    modes_dir = root / "modes"
-    names: list[str] = []
+    """Mode names from modes/*.json; rescans only when the directory changes."""
+    global _modes_cache
     try:
-        for path in glob.glob(str(modes_dir / "*.json")):
-            name = Path(path).stem
-            names.append(name)
+        mtime = os.stat(MODES_DIR).st_mtime_ns
+        cached = _modes_cache
+        if cached is None or cached[0] != mtime:
+            with os.scandir(MODES_DIR) as entries:
+                names = [
+                    entry.name[:-5]
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+            _modes_cache = cached = (mtime, names)
     except Exception:
         return ["general"]
-    return names or ["general"]
+    return list(cached[1]) or ["general"]
 
 
 def _hex_to_rgb(color: str) -> tuple[int, int, int]:
@@ -71,24 +102,13 @@ def _hex_to_rgb(color: str) -> tuple[int, int, int]:
         # Fallback to white if the color format is unexpected
         return (255, 255, 255)
     try:
-        r = int(color[0:2], 16)
-        g = int(color[2:4], 16)
-        b = int(color[4:6], 16)
+        r, g, b = bytes.fromhex(color)
     except ValueError:
         # Fallback to white on parse error
         return (255, 255, 255)
     return (r, g, b)
 
 
-def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
-    """Convert an (r, g, b) tuple to a hex color string '#rrggbb'."""
-    r, g, b = rgb
-    r = max(0, min(255, r))
-    g = max(0, min(255, g))
-    b = max(0, min(255, b))
-    return f"#{r:02x}{g:02x}{b:02x}"
-
-
 def _interpolate_rgb(
     start: tuple[int, int, int],
     end: tuple[int, int, int],
@@ -104,43 +124,84 @@ def _interpolate_rgb(
     return (r, g, b)
 
 
+@functools.lru_cache(maxsize=8)
 def create_gradient_text(text: str, start_color: str, end_color: str) -> Text:
-    """Create text with gradient color effect."""
-    result = Text()
+    """Create text with gradient color effect.
+
+    Cached: the header is rebuilt every frame from the same inputs. Callers share
+    the returned Text and must not modify it.
+    """
     lines = text.split('\n')
-    
-    # Prepare gradient endpoints
-    start_rgb = _hex_to_rgb(start_color)
-    end_rgb = _hex_to_rgb(end_color)
+    filled = [bool(line.strip()) for line in lines]
     
     # Count non-empty lines to spread the gradient across them
-    non_empty_count = sum(1 for line in lines if line.strip())
+    non_empty_count = sum(filled)
     if non_empty_count == 0:
-        return result
-    
-    current_index = 0
-    for line in lines:
-        if line.strip():
-            if non_empty_count == 1:
-                ratio = 0.0
-            else:
-                ratio = current_index / (non_empty_count - 1)
-            rgb = _interpolate_rgb(start_rgb, end_rgb, ratio)
-            color_hex = _rgb_to_hex(rgb)
-            result.append(line + "\n", style=Style(color=color_hex, bold=True))
-            current_index += 1
-        else:
-            result.append("\n")
+        return Text()
     
-    return result
+    # Blank lines (including the logo's leading and trailing ones, which pad the
+    # header) stay unstyled; each filled line takes the next step of the ramp.
+    styles = iter(_gradient_styles(start_color, end_color, non_empty_count))
+    return Text().append_tokens(
+        (line + "\n", next(styles)) if has_text else ("\n", None)
+        for line, has_text in zip(lines, filled)
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _gradient_styles(start_color: str, end_color: str, steps: int) -> tuple[Style, ...]:
+    """Bold styles stepping evenly from start_color to end_color, one per line."""
+    # Endpoints are bytes and the ratio is clamped, so every step is a valid RGB
+    # triplet and can become a Color directly without a hex round trip.
+    start_rgb = _hex_to_rgb(start_color)
+    end_rgb = _hex_to_rgb(end_color)
+    if steps == 1:
+        return (Style(color=Color.from_rgb(*start_rgb), bold=True),)
+    return tuple(
+        Style(color=Color.from_rgb(*_interpolate_rgb(start_rgb, end_rgb, index / (steps - 1))), bold=True)
+        for index in range(steps)
+    )
+
+
+class _StaticRenderable:
+    """Replay the segments of a renderable that never changes.
+
+    The aligned logo is rendered into segments once per available size (so a
+    terminal resize renders it afresh); later frames yield the stored segments
+    instead of re-measuring, padding and re-styling it.
+    """
+
+    def __init__(self, renderable: RenderableType) -> None:
+        self._renderable = renderable
+        self._lines: dict[tuple[int, int | None], list[list[Segment]]] = {}
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        size = (options.max_width, options.height)
+        lines = self._lines.get(size)
+        if lines is None:
+            if len(self._lines) >= 8:
+                self._lines.clear()
+            lines = console.render_lines(self._renderable, options, pad=False)
+            self._lines[size] = lines
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement.get(console, options, self._renderable)
 
 
 def create_ui_layout() -> Layout:
-    """Create the main UI layout."""
+    """Create the main UI layout.
+
+    The header never changes, so it is filled in here; render_ui only updates the
+    body and footer.
+    """
     layout = Layout()
     
     layout.split_column(
-        Layout(name="header", size=8),
+        Layout(_HEADER, name="header", size=8),
         Layout(name="body"),
         Layout(name="footer", size=4),
     )
@@ -148,7 +209,7 @@ def create_ui_layout() -> Layout:
     return layout
 
 
-@dataclass
+@dataclass(slots=True)
 class UIState:
     view: str = "menu"
     menu_index: int = 0
@@ -172,29 +233,90 @@ class UIState:
 
 MENU_OPTIONS = ["Open Client", "Start Gateway"]
 
+# Traffic lines shown under the gateway status; the backend keeps a longer log, but
+# more than this does not fit the body pane of a typical 40-row terminal.
+GATEWAY_TRAFFIC_LINES = 10
+
+_HEADER = _StaticRenderable(
+    Align.center(create_gradient_text(MESHTASTIC_LOGO, "#00ffff", "#0033ff"), vertical="top")
+)
+
+# Backend state is checked once per frame; keys wake the loop immediately. Idle
+# frames are neither rebuilt nor repainted; re-render at least every heartbeat for
+# time-based text.
+FRAME_INTERVAL_SECONDS = 0.1
+RENDER_HEARTBEAT_SECONDS = 1.0
+
 
 class KeyReader:
     def __init__(self) -> None:
-        self._queue: queue.Queue[str] = queue.Queue()
+        # Single producer (the reader thread) and single consumer (the UI loop):
+        # deque append/popleft are atomic under the GIL, so keys need no lock, only
+        # an Event the consumer parks on while the deque is empty.
+        self._keys: deque[str] = deque()
+        self._key_ready = threading.Event()
         self._stop_event = threading.Event()
         self._thread = threading.Thread(
             target=self._run,
             daemon=True,
             name="ui-key-reader",
         )
+        # Self-pipe: stop() writes a byte so the POSIX reader can block in select()
+        # without a timeout and still exit promptly.
+        self._wakeup_r: int | None = None
+        self._wakeup_w: int | None = None
+        if os.name != "nt":
+            self._wakeup_r, self._wakeup_w = os.pipe()
 
     def start(self) -> None:
         self._thread.start()
 
     def stop(self) -> None:
         self._stop_event.set()
+        if self._wakeup_w is not None:
+            try:
+                os.write(self._wakeup_w, b"\0")
+            except OSError:
+                pass
         self._thread.join(timeout=1.0)
+        if not self._thread.is_alive():
+            for fd in (self._wakeup_r, self._wakeup_w):
+                if fd is not None:
+                    os.close(fd)
+            self._wakeup_r = self._wakeup_w = None
 
     def get_key(self) -> str | None:
         try:
-            return self._queue.get_nowait()
-        except queue.Empty:
+            return self._keys.popleft()
+        except IndexError:
+            return None
+
+    def get_keys(self) -> list[str]:
+        """Drain every key queued so far (e.g. a held arrow's repeats)."""
+        keys: list[str] = []
+        pending = self._keys
+        try:
+            while True:
+                keys.append(pending.popleft())
+        except IndexError:
+            return keys
+
+    def get_key_blocking(self, timeout: float) -> str | None:
+        """Wait up to ``timeout`` seconds for a key."""
+        pending = self._keys
+        try:
+            return pending.popleft()
+        except IndexError:
+            pass
+        # Clear before re-checking so a key pushed meanwhile still wakes the wait.
+        self._key_ready.clear()
+        if not pending and not self._key_ready.wait(timeout):
             return None
+        return self.get_key()
+
+    def _push(self, key: str) -> None:
+        self._keys.append(key)
+        self._key_ready.set()
 
     def _run(self) -> None:
         if os.name == "nt":
@@ -211,7 +333,7 @@ class KeyReader:
                 continue
             key = _read_key_windows()
             if key:
-                self._queue.put(key)
+                self._push(key)
 
     def _run_posix(self) -> None:
         import select
@@ -219,90 +341,130 @@ class KeyReader:
         import tty
 
         fd = sys.stdin.fileno()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         old_settings = termios.tcgetattr(fd)
         tty.setraw(fd)
         try:
             while not self._stop_event.is_set():
-                readable, _, _ = select.select([sys.stdin], [], [], 0.1)
-                if not readable:
-                    continue
-                key = _read_key_posix()
-                if key:
-                    self._queue.put(key)
+                readable, _, _ = select.select([fd, self._wakeup_r], [], [])
+                if self._wakeup_r in readable:
+                    break
+                for key in _read_keys_posix(fd, decoder):
+                    self._push(key)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
+_WINDOWS_SPECIAL_KEYS = {"H": "up", "P": "down", "K": "left", "M": "right", "I": "pgup", "Q": "pgdn"}
+_WINDOWS_CONTROL_KEYS = {"\r": "enter", "\x08": "backspace", "\x1b": "esc", "\x10": "ctrl+p", "\t": "tab"}
+
+
 def _read_key_windows() -> str | None:
     import msvcrt
 
     ch = msvcrt.getwch()
     if ch in ("\x00", "\xe0"):
-        ch2 = msvcrt.getwch()
-        mapping = {
-            "H": "up",
-            "P": "down",
-            "K": "left",
-            "M": "right",
-            "I": "pgup",
-            "Q": "pgdn",
-        }
-        return mapping.get(ch2)
-    if ch == "\r":
-        return "enter"
-    if ch == "\x08":
-        return "backspace"
-    if ch == "\x1b":
-        return "esc"
-    if ch == "\x10":  # Ctrl+P
-        return "ctrl+p"
-    if ch == "\t":
-        return "tab"
-    return ch
-
-
-def _read_key_posix() -> str | None:
-    ch = sys.stdin.read(1)
-    if ch == "\x1b":
-        nxt = sys.stdin.read(2)
-        if nxt in ("[A", "[B", "[C", "[D"):
-            mapping = {"[A": "up", "[B": "down", "[C": "right", "[D": "left"}
-            return mapping.get(nxt, "esc")
-        if nxt == "[5":
-            sys.stdin.read(1)
-            return "pgup"
-        if nxt == "[6":
-            sys.stdin.read(1)
-            return "pgdn"
-        return "esc"
-    if ch == "\x10":
-        return "ctrl+p"
-    if ch in ("\r", "\n"):
-        return "enter"
-    if ch == "\x7f":
-        return "backspace"
-    if ch == "\t":
-        return "tab"
-    return ch
-
-
-
-
-def render_ui(console: Console, backend_state: BackendState, ui_state: UIState) -> Layout:
-    """Render the beautiful UI."""
-    layout = create_ui_layout()
-    content_width = max(20, console.size.width - 20)
+        return _WINDOWS_SPECIAL_KEYS.get(msvcrt.getwch())
+    return _WINDOWS_CONTROL_KEYS.get(ch, ch)
+
+
+_ESCAPE_KEYS = {"[A": "up", "[B": "down", "[C": "right", "[D": "left", "[5~": "pgup", "[6~": "pgdn"}
+_CONTROL_KEYS = {"\x10": "ctrl+p", "\r": "enter", "\n": "enter", "\x7f": "backspace", "\t": "tab"}
+_ESCAPE_TIMEOUT = 0.05  # seconds to wait for the rest of a split escape sequence
+
+
+def _read_keys_posix(fd: int, decoder: codecs.IncrementalDecoder) -> list[str]:
+    import select
+
+    # One read usually picks up a whole escape sequence (or a pasted burst), but
+    # over SSH or a slow tty the sequence can be split across reads.
+    data = os.read(fd, 64)
+    if not data:
+        return []
+    text = decoder.decode(data)
+    while _has_partial_escape(text):
+        readable, _, _ = select.select([fd], [], [], _ESCAPE_TIMEOUT)
+        if not readable:
+            break
+        data = os.read(fd, 64)
+        if not data:
+            break
+        text += decoder.decode(data)
+    return _parse_keys(text)
+
+
+def _has_partial_escape(text: str) -> bool:
+    start = text.rfind("\x1b")
+    if start < 0:
+        return False
+    tail = text[start + 1 :]
+    if not tail:
+        return True
+    if tail[0] not in "[O":
+        return False
+    return not any("\x40" <= ch <= "\x7e" for ch in tail[1:])
+
+
+def _parse_keys(data: str) -> list[str]:
+    keys: list[str] = []
+    index = 0
+    length = len(data)
+    while index < length:
+        ch = data[index]
+        index += 1
+        if ch != "\x1b":
+            keys.append(_CONTROL_KEYS.get(ch, ch))
+            continue
+        for sequence, name in _ESCAPE_KEYS.items():
+            if data.startswith(sequence, index):
+                keys.append(name)
+                index += len(sequence)
+                break
+        else:
+            if data.startswith(("[", "O"), index):
+                # Swallow unrecognised CSI/SS3 sequences up to their final byte.
+                index += 1
+                while index < length and not "\x40" <= data[index] <= "\x7e":
+                    index += 1
+                index += 1
+            keys.append("esc")
+    return keys
+
+
+def render_ui(
+    console: Console,
+    backend_state: BackendState,
+    ui_state: UIState,
+    layout: Layout | None = None,
+    width: int | None = None,
+) -> Layout:
+    """Render the beautiful UI.
+
+    Pass the layout from a previous call to refresh its panes in place, and the
+    terminal width when the caller has already read the console size.
+    """
+    if layout is None:
+        layout = create_ui_layout()
+    if width is None:
+        width = console.size.width
+    content_width = max(20, width - 20)
     if ui_state.palette_open:
         if ui_state.palette_options is None:
             ui_state.palette_options = []
         ui_state.palette_index = _clamp_scroll(ui_state.palette_index, len(ui_state.palette_options), 1)
     
-    # Header with logo
-    logo_text = create_gradient_text(MESHTASTIC_LOGO, "#00ffff", "#0033ff")
-    layout["header"].update(Align.center(logo_text, vertical="top"))
+    if ui_state.view == "gateway" and not ui_state.palette_open:
+        body = _gateway_pane(backend_state, ui_state)
+    else:
+        body = _body_pane(_render_body(backend_state, ui_state, content_width))
+    layout["body"].update(body)
     
-    content_text = _render_body(backend_state, ui_state, content_width)
+    layout["footer"].update(_footer_pane(ui_state.view, BRIDGE_VERSION))
     
+    return layout
+
+
+def _body_pane(content_text: Text) -> Align:
     input_panel = Panel(
         Align.center(content_text, vertical="middle"),
         border_style="cyan",
@@ -310,14 +472,23 @@ def render_ui(console: Console, backend_state: BackendState, ui_state: UIState)
         title=f"[bold cyan]Meshtastic {BRIDGE_SUBTITLE}[/bold cyan]",
         title_align="center"
     )
-    
-    layout["body"].update(Align.center(input_panel, vertical="top"))
-    
-    footer_text = _render_footer(ui_state)
-    
-    layout["footer"].update(Align.center(footer_text, vertical="bottom"))
-    
-    return layout
+    return Align.center(input_panel, vertical="top")
+
+
+# (snapshot, mode label, pane) of the last gateway frame. The gateway body depends
+# only on those two, so heartbeat and key-only frames reuse the pane as-is.
+_gateway_pane_cache: tuple[BackendState, str, Align] | None = None
+
+
+def _gateway_pane(backend_state: BackendState, ui_state: UIState) -> Align:
+    global _gateway_pane_cache
+    mode_label = _current_mode_label(ui_state)
+    cached = _gateway_pane_cache
+    if cached is not None and cached[0] is backend_state and cached[1] == mode_label:
+        return cached[2]
+    pane = _body_pane(_render_gateway_body(backend_state, ui_state))
+    _gateway_pane_cache = (backend_state, mode_label, pane)
+    return pane
 
 
 def _render_body(backend_state: BackendState, ui_state: UIState, content_width: int) -> Text:
@@ -331,87 +502,88 @@ def _render_body(backend_state: BackendState, ui_state: UIState, content_width:
 
 
 def _render_menu_body(backend_state: BackendState, ui_state: UIState) -> Text:
-    text = Text()
-    text.append("Select Mode\n\n", style="bold cyan")
+    parts: list[tuple[str, Style | None]] = []
+    parts.append(("Select Mode\n\n", STYLE_HEADING))
     for index, option in enumerate(MENU_OPTIONS):
         disabled = not backend_state.radio_detected
         prefix = "> " if index == ui_state.menu_index else "  "
         if disabled:
-            style = "dim"
+            style = STYLE_DIM
         else:
-            style = "bold white" if index == ui_state.menu_index else "dim"
-        text.append(f"{prefix}{option}\n", style=style)
-    text.append("\nRadio: ", style="bold cyan")
+            style = STYLE_KEY if index == ui_state.menu_index else STYLE_DIM
+        parts.append((f"{prefix}{option}\n", style))
+    parts.append(("\nRadio: ", STYLE_HEADING))
     if backend_state.radio_detected:
         ports = ", ".join(backend_state.radio_ports)
-        text.append("Detected", style="green")
+        parts.append(("Detected", STYLE_OK))
         if ports:
-            text.append(f" ({ports})", style="green")
+            parts.append((f" ({ports})", STYLE_OK))
     else:
-        text.append("Not Found", style="red")
+        parts.append(("Not Found", STYLE_ERROR))
         if backend_state.last_error:
-            text.append(" (check drivers)", style="yellow")
-        text.append("\n\nConnect a radio to enable menu options.", style="dim")
-    return text
+            parts.append((" (check drivers)", STYLE_WARNING))
+        parts.append(("\n\nConnect a radio to enable menu options.", STYLE_DIM))
+    return Text().append_tokens(parts)
 
 
 def _render_gateway_body(backend_state: BackendState, ui_state: UIState) -> Text:
-    text = Text()
-    text.append("Gateway Running\n\n", style="bold cyan")
+    parts: list[tuple[str, Style | None]] = []
+    parts.append(("Gateway Running\n\n", STYLE_HEADING))
     if backend_state.gateway_error:
-        text.append("Gateway Error: ", style="bold red")
-        text.append(backend_state.gateway_error, style="red")
-        text.append("\n\n")
-    text.append("Connected Radio: ", style="bold cyan")
+        parts.append(("Gateway Error: ", STYLE_ERROR_HEADING))
+        parts.append((backend_state.gateway_error, STYLE_ERROR))
+        parts.append(("\n\n", None))
+    parts.append(("Connected Radio: ", STYLE_HEADING))
     if backend_state.radio_ports:
-        text.append(backend_state.radio_ports[0], style="green")
+        parts.append((backend_state.radio_ports[0], STYLE_OK))
     else:
-        text.append("none", style="dim")
-    text.append("\n", style="dim")
-    text.append("Mode: ", style="bold cyan")
-    text.append(_current_mode_label(ui_state), style="green")
-    text.append("\n", style="dim")
-    text.append("Local Radio ID: ", style="bold cyan")
+        parts.append(("none", STYLE_DIM))
+    parts.append(("\n", STYLE_DIM))
+    parts.append(("Mode: ", STYLE_HEADING))
+    parts.append((_current_mode_label(ui_state), STYLE_OK))
+    parts.append(("\n", STYLE_DIM))
+    parts.append(("Local Radio ID: ", STYLE_HEADING))
     if backend_state.local_radio_id:
-        text.append(backend_state.local_radio_id, style="green")
+        parts.append((backend_state.local_radio_id, STYLE_OK))
     elif backend_state.gateway_error:
-        text.append("Search failed", style="red")
+        parts.append(("Search failed", STYLE_ERROR))
     else:
-        text.append("Searching...", style="dim")
-    text.append("\nConnected Radios: ", style="bold cyan")
+        parts.append(("Searching...", STYLE_DIM))
+    parts.append(("\nConnected Radios: ", STYLE_HEADING))
     if backend_state.connected_radios:
-        text.append(", ".join(backend_state.connected_radios), style="green")
+        parts.append((", ".join(backend_state.connected_radios), STYLE_OK))
     else:
-        text.append("none", style="dim")
-    text.append("\nLast RX: ", style="bold cyan")
-    text.append(_format_timestamp(backend_state.last_rx_time), style="green")
-    text.append("\nLast TX: ", style="bold cyan")
-    text.append(_format_timestamp(backend_state.last_tx_time), style="green")
-    text.append("\nSpool Depth: ", style="bold cyan")
-    text.append(str(backend_state.spool_depth), style="green")
-    text.append("\nLast Payload: ", style="bold cyan")
+        parts.append(("none", STYLE_DIM))
+    parts.append(("\nLast RX: ", STYLE_HEADING))
+    parts.append((_format_timestamp(backend_state.last_rx_time), STYLE_OK))
+    parts.append(("\nLast TX: ", STYLE_HEADING))
+    parts.append((_format_timestamp(backend_state.last_tx_time), STYLE_OK))
+    parts.append(("\nSpool Depth: ", STYLE_HEADING))
+    parts.append((str(backend_state.spool_depth), STYLE_OK))
+    parts.append(("\nLast Payload: ", STYLE_HEADING))
     if backend_state.gateway_last_payload:
-        text.append(backend_state.gateway_last_payload, style="green")
+        parts.append((backend_state.gateway_last_payload, STYLE_OK))
     else:
-        text.append("none", style="dim")
+        parts.append(("none", STYLE_DIM))
     if backend_state.gateway_last_chunks_total:
-        text.append("\nChunks: ", style="bold cyan")
-        text.append(str(backend_state.gateway_last_chunks_total), style="green")
-    text.append("\n\nTraffic:\n", style="bold cyan")
+        parts.append(("\nChunks: ", STYLE_HEADING))
+        parts.append((str(backend_state.gateway_last_chunks_total), STYLE_OK))
+    parts.append(("\n\nTraffic:\n", STYLE_HEADING))
     if backend_state.gateway_traffic:
-        for line in backend_state.gateway_traffic:
-            text.append(f"{line}\n", style="dim")
+        # Newest first; one dim span for the visible lines instead of one per line.
+        traffic = backend_state.gateway_traffic[:GATEWAY_TRAFFIC_LINES]
+        parts.append(("\n".join(traffic) + "\n", STYLE_DIM))
     else:
-        text.append("No traffic yet\n", style="dim")
-    return text
+        parts.append(("No traffic yet\n", STYLE_DIM))
+    return Text().append_tokens(parts)
 
 
 def _render_palette_view(ui_state: UIState) -> Text:
     text = Text()
-    text.append("Command Palette\n\n", style="bold cyan")
+    text.append("Command Palette\n\n", style=STYLE_HEADING)
     text.append(_render_palette(ui_state))
-    text.append("\n\n", style="dim")
-    text.append("Esc to close | Up/Down to navigate | Enter to run", style="dim")
+    text.append("\n\n", style=STYLE_DIM)
+    text.append("Esc to close | Up/Down to navigate | Enter to run", style=STYLE_DIM)
     return text
 
 
@@ -420,35 +592,35 @@ def _render_client_body(
     ui_state: UIState,
     content_width: int,
 ) -> Text:
-    text = Text()
-    text.append("Client Mode\n\n", style="bold cyan")
+    parts: list[tuple[str, Style | None]] = []
+    parts.append(("Client Mode\n\n", STYLE_HEADING))
     
     # Show web browser info if started
     if ui_state.web_browser_started:
-        text.append("Web Browser: ", style="bold cyan")
+        parts.append(("Web Browser: ", STYLE_HEADING))
         browser_url = f"http://127.0.0.1:{ui_state.web_browser_port}"
-        text.append(browser_url, style="bold green underline")
-        text.append("\n", style="dim")
+        parts.append((browser_url, STYLE_LINK))
+        parts.append(("\n", STYLE_DIM))
     
-    text.append("Connected Radio: ", style="bold cyan")
+    parts.append(("Connected Radio: ", STYLE_HEADING))
     if backend_state.radio_ports:
-        text.append(backend_state.radio_ports[0], style="green")
+        parts.append((backend_state.radio_ports[0], STYLE_OK))
     else:
-        text.append("none", style="dim")
-    text.append("\nMode: ", style="bold cyan")
-    text.append(_current_mode_label(ui_state), style="green")
-    text.append("\nLocal Radio ID: ", style="bold cyan")
+        parts.append(("none", STYLE_DIM))
+    parts.append(("\nMode: ", STYLE_HEADING))
+    parts.append((_current_mode_label(ui_state), STYLE_OK))
+    parts.append(("\nLocal Radio ID: ", STYLE_HEADING))
     if backend_state.local_radio_id:
-        text.append(backend_state.local_radio_id, style="green")
+        parts.append((backend_state.local_radio_id, STYLE_OK))
     else:
-        text.append("Searching...", style="dim")
-    text.append("\nLast RX: ", style="bold cyan")
-    text.append(_format_timestamp(backend_state.last_rx_time), style="green")
-    text.append("\nLast TX: ", style="bold cyan")
-    text.append(_format_timestamp(backend_state.last_tx_time), style="green")
-    text.append("\nSpool Depth: ", style="bold cyan")
-    text.append(str(backend_state.spool_depth), style="green")
-    text.append("\n\n", style="dim")
+        parts.append(("Searching...", STYLE_DIM))
+    parts.append(("\nLast RX: ", STYLE_HEADING))
+    parts.append((_format_timestamp(backend_state.last_rx_time), STYLE_OK))
+    parts.append(("\nLast TX: ", STYLE_HEADING))
+    parts.append((_format_timestamp(backend_state.last_tx_time), STYLE_OK))
+    parts.append(("\nSpool Depth: ", STYLE_HEADING))
+    parts.append((str(backend_state.spool_depth), STYLE_OK))
+    parts.append(("\n\n", STYLE_DIM))
     fields = [
         ("Gateway ID", ui_state.client_gateway_id),
         ("URL", ui_state.client_url),
@@ -456,27 +628,27 @@ def _render_client_body(
     for index, (label, value) in enumerate(fields):
         active = index == ui_state.client_active_field
         prefix = "> " if active else "  "
-        style = "bold white" if active else "dim"
+        style = STYLE_KEY if active else STYLE_DIM
         display = value or "(empty)"
-        text.append(f"{prefix}{label}: {display}\n", style=style)
-    text.append("\nStatus: ", style="bold cyan")
-    text.append(backend_state.client_status or "idle", style="green")
-    text.append("\nSend: ", style="bold cyan")
-    text.append(_format_progress(
+        parts.append((f"{prefix}{label}: {display}\n", style))
+    parts.append(("\nStatus: ", STYLE_HEADING))
+    parts.append((backend_state.client_status or "idle", STYLE_OK))
+    parts.append(("\nSend: ", STYLE_HEADING))
+    parts.append((_format_progress(
         backend_state.client_send_chunks_sent,
         backend_state.client_send_chunks_total,
         backend_state.client_send_eta_seconds,
-    ), style="green")
-    text.append("\nReceive: ", style="bold cyan")
-    text.append(_format_progress(
+    ), STYLE_OK))
+    parts.append(("\nReceive: ", STYLE_HEADING))
+    parts.append((_format_progress(
         backend_state.client_recv_chunks_received,
         backend_state.client_recv_chunks_total,
         backend_state.client_recv_eta_seconds,
-    ), style="green")
+    ), STYLE_OK))
     if backend_state.client_response:
-        text.append(f"\nResponse: {backend_state.client_response}", style="green")
+        parts.append((f"\nResponse: {backend_state.client_response}", STYLE_OK))
     if backend_state.client_error:
-        text.append(f"\nError: {backend_state.client_error}", style="red")
+        parts.append((f"\nError: {backend_state.client_error}", STYLE_ERROR))
     if backend_state.client_last_payload_decoded:
         decoded_lines = _wrap_payload(backend_state.client_last_payload_decoded, content_width - 8)
         max_lines = 6
@@ -484,9 +656,9 @@ def _render_client_body(
         start = ui_state.client_scroll
         end = min(start + max_lines, len(decoded_lines))
         range_label = f"{start + 1}-{end} of {len(decoded_lines)}"
-        text.append(f"\nPayload ({range_label}):", style="bold cyan")
+        parts.append((f"\nPayload ({range_label}):", STYLE_HEADING))
         for line in decoded_lines[start:end]:
-            text.append(f"\n{line}", style="green")
+            parts.append((f"\n{line}", STYLE_OK))
     elif backend_state.client_last_payload:
         payload_lines = _wrap_payload(backend_state.client_last_payload, content_width - 8)
         max_lines = 4
@@ -494,17 +666,17 @@ def _render_client_body(
         start = ui_state.client_scroll
         end = min(start + max_lines, len(payload_lines))
         range_label = f"{start + 1}-{end} of {len(payload_lines)}"
-        text.append(f"\nPayload ({range_label}):", style="bold cyan")
+        parts.append((f"\nPayload ({range_label}):", STYLE_HEADING))
         for line in payload_lines[start:end]:
-            text.append(f"\n{line}", style="green")
+            parts.append((f"\n{line}", STYLE_OK))
     if backend_state.client_history:
-        text.append("\n\nRecent Responses:", style="bold cyan")
+        parts.append(("\n\nRecent Responses:", STYLE_HEADING))
         for entry in backend_state.client_history[:3]:
-            text.append(f"\n{entry}", style="dim")
+            parts.append((f"\n{entry}", STYLE_DIM))
     notice = _notice_text(ui_state)
     if notice:
-        text.append(f"\n\n{notice}", style="yellow")
-    return text
+        parts.append((f"\n\n{notice}", STYLE_WARNING))
+    return Text().append_tokens(parts)
 
 
 def _format_progress(sent: int, total: int, eta_seconds: float | None) -> str:
@@ -517,12 +689,14 @@ def _format_progress(sent: int, total: int, eta_seconds: float | None) -> str:
     return f"{percent}% ({sent}/{total}){eta_text}"
 
 
-def _wrap_payload(payload: str, width: int) -> list[str]:
+@functools.lru_cache(maxsize=16)
+def _wrap_payload(payload: str, width: int) -> tuple[str, ...]:
+    """Wrapped payload lines; cached because the client view re-wraps every frame."""
     width = max(10, width)
     lines: list[str] = []
     for line in payload.splitlines() or [""]:
         lines.extend(textwrap.wrap(line, width=width) or [""])
-    return lines
+    return tuple(lines)
 
 
 def _clamp_scroll(offset: int, total: int, window: int) -> int:
@@ -601,26 +775,32 @@ def _build_palette_options(ui_state: UIState, backend_state: BackendState) -> li
 
 
 def _render_palette(ui_state: UIState) -> Text:
-    text = Text()
     options = ui_state.palette_options or []
     total = len(options)
     if not options:
-        text.append("No commands available", style="dim")
-        return text
+        return Text().append("No commands available", style=STYLE_DIM)
+    parts: list[tuple[str, Style | None]] = []
     ui_state.palette_index = _clamp_scroll(ui_state.palette_index, total, 1)
     for idx, opt in enumerate(options):
         prefix = "> " if idx == ui_state.palette_index else "  "
-        style = "bold white" if idx == ui_state.palette_index else "dim"
+        style = STYLE_KEY if idx == ui_state.palette_index else STYLE_DIM
         if not opt.get("enabled", True):
-            style = "grey50"
-        text.append(f"{prefix}{opt.get('label','')}\n", style=style)
-    return text
+            style = STYLE_DISABLED
+        parts.append((f"{prefix}{opt.get('label','')}\n", style))
+    return Text().append_tokens(parts)
 
 
 def _format_timestamp(ts: float | None) -> str:
     if not ts:
         return "none"
-    return time.strftime("%H:%M:%S", time.localtime(ts))
+    return _format_second(int(ts))
+
+
+# Last RX and last TX are both shown every frame but change at most once a second,
+# so a handful of entries covers them without re-running localtime/strftime.
+@functools.lru_cache(maxsize=4)
+def _format_second(second: int) -> str:
+    return time.strftime("%H:%M:%S", time.localtime(second))
 
 
 def _cycle_mode(ui_state: UIState) -> None:
@@ -650,21 +830,26 @@ def _notice_text(ui_state: UIState, ttl_seconds: float = 3.0) -> str | None:
     return ui_state.client_notice
 
 
+# Clipboard helpers per platform, tried in order; tkinter is the last resort
+# because it starts a whole Tcl interpreter for every copy.
+_CLIPBOARD_COMMANDS: dict[str, list[list[str]]] = {
+    "darwin": [["pbcopy"]],
+    "wayland": [["wl-copy"]],
+    "x11": [["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]],
+}
+
+
 def _copy_to_clipboard(text: str) -> bool:
-    # Prefer PowerShell on Windows for reliable clipboard setting
     if os.name == "nt":
         try:
-            import subprocess
-
-            subprocess.run(
-                ["powershell", "-NoProfile", "-Command", "Set-Clipboard", "-Value", text],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            return True
+            if _copy_windows_clipboard(text):
+                return True
         except Exception:
             pass
+    else:
+        for command in _clipboard_commands():
+            if _pipe_to_command(command, text):
+                return True
 
     # Fallback to tkinter clipboard (works on most platforms)
     try:
@@ -681,7 +866,81 @@ def _copy_to_clipboard(text: str) -> bool:
         return False
 
 
-def _handle_palette_key(key: str, ui_state: UIState, backend: BackendService) -> None:
+def _clipboard_commands() -> list[list[str]]:
+    if sys.platform == "darwin":
+        return _CLIPBOARD_COMMANDS["darwin"]
+    commands: list[list[str]] = []
+    if os.environ.get("WAYLAND_DISPLAY"):
+        commands += _CLIPBOARD_COMMANDS["wayland"]
+    if os.environ.get("DISPLAY"):
+        commands += _CLIPBOARD_COMMANDS["x11"]
+    return commands
+
+
+def _pipe_to_command(command: list[str], text: str) -> bool:
+    import shutil
+    import subprocess
+
+    if shutil.which(command[0]) is None:
+        return False
+    try:
+        subprocess.run(
+            command,
+            input=text.encode("utf-8"),
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=2.0,
+        )
+        return True
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _copy_windows_clipboard(text: str) -> bool:  # pragma: no cover - Windows only
+    import ctypes
+    from ctypes import wintypes
+
+    cf_unicodetext = 13
+    gmem_moveable = 0x0002
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    user32.OpenClipboard.argtypes = (wintypes.HWND,)
+    user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(gmem_moveable, len(data))
+        if not handle:
+            return False
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(pointer, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        # On success the clipboard owns the memory; only free it on failure.
+        if not user32.SetClipboardData(cf_unicodetext, handle):
+            kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
+
+
+def _handle_palette_key(
+    key: str, ui_state: UIState, backend: BackendService, snapshot: BackendState
+) -> None:
     options = ui_state.palette_options or []
     if not options:
         ui_state.palette_open = False
@@ -702,12 +961,12 @@ def _handle_palette_key(key: str, ui_state: UIState, backend: BackendService) ->
         action = option.get("action")
         if action == "mode":
             ui_state.palette_context = "mode"
-            ui_state.palette_options = _build_palette_options(ui_state, backend.snapshot())
+            ui_state.palette_options = _build_palette_options(ui_state, snapshot)
             ui_state.palette_index = 0
             return
         if action == "radio":
             ui_state.palette_context = "radio"
-            ui_state.palette_options = _build_palette_options(ui_state, backend.snapshot())
+            ui_state.palette_options = _build_palette_options(ui_state, snapshot)
             ui_state.palette_index = 0
             return
         if action == "set-mode":
@@ -721,7 +980,6 @@ def _handle_palette_key(key: str, ui_state: UIState, backend: BackendService) ->
                 backend.send_health_request(ui_state.client_gateway_id.strip())
                 _set_notice(ui_state, "Health request sent")
         elif action == "copy":
-            snapshot = backend.snapshot()
             payload = (
                 snapshot.client_last_payload_decoded
                 or snapshot.client_last_payload_raw
@@ -740,7 +998,7 @@ def _handle_palette_key(key: str, ui_state: UIState, backend: BackendService) ->
                 _set_notice(ui_state, f"Radio set to {selected}")
         elif action == "back":
             ui_state.palette_context = None
-            ui_state.palette_options = _build_palette_options(ui_state, backend.snapshot())
+            ui_state.palette_options = _build_palette_options(ui_state, snapshot)
             ui_state.palette_index = 0
             return
         elif action == "close":
@@ -752,48 +1010,62 @@ def _handle_palette_key(key: str, ui_state: UIState, backend: BackendService) ->
 
 
 def _render_footer(ui_state: UIState) -> Text:
+    return _build_footer(ui_state.view, BRIDGE_VERSION)
+
+
+@functools.lru_cache(maxsize=8)
+def _footer_pane(view: str, version: str) -> Align:
+    """Bottom-aligned footer for a view, shared between frames like the footer text."""
+    return Align.center(_build_footer(view, version), vertical="bottom")
+
+
+@functools.lru_cache(maxsize=8)
+def _build_footer(view: str, version: str) -> Text:
+    """Footer for a view; cached and shared between frames, so never modify it."""
     text = Text()
-    text.append("Ctrl+C", style="bold white")
-    text.append(" to exit", style="dim")
-    text.append(" | ", style="dim")
-    if ui_state.view == "menu":
-        text.append("Arrows", style="bold white")
-        text.append(" to navigate, ", style="dim")
-        text.append("Enter", style="bold white")
-        text.append(" to select", style="dim")
-    elif ui_state.view == "gateway":
-        text.append("Q/Esc", style="bold white")
-        text.append(" to stop gateway", style="dim")
-    elif ui_state.view == "client":
-        text.append("Tab", style="bold white")
-        text.append(" to switch, ", style="dim")
-        text.append("Enter", style="bold white")
-        text.append(" to submit", style="dim")
-        text.append(", ", style="dim")
-        text.append("Esc", style="bold white")
-        text.append(" menu", style="dim")
-    text.append(" | ", style="dim")
-    text.append("Ctrl+P for commands", style="dim")
-    text.append(" | ", style="dim")
-    text.append(f"v{BRIDGE_VERSION}", style="dim")
+    text.append("Ctrl+C", style=STYLE_KEY)
+    text.append(" to exit", style=STYLE_DIM)
+    text.append(" | ", style=STYLE_DIM)
+    if view == "menu":
+        text.append("Arrows", style=STYLE_KEY)
+        text.append(" to navigate, ", style=STYLE_DIM)
+        text.append("Enter", style=STYLE_KEY)
+        text.append(" to select", style=STYLE_DIM)
+    elif view == "gateway":
+        text.append("Q/Esc", style=STYLE_KEY)
+        text.append(" to stop gateway", style=STYLE_DIM)
+    elif view == "client":
+        text.append("Tab", style=STYLE_KEY)
+        text.append(" to switch, ", style=STYLE_DIM)
+        text.append("Enter", style=STYLE_KEY)
+        text.append(" to submit", style=STYLE_DIM)
+        text.append(", ", style=STYLE_DIM)
+        text.append("Esc", style=STYLE_KEY)
+        text.append(" menu", style=STYLE_DIM)
+    text.append(" | ", style=STYLE_DIM)
+    text.append("Ctrl+P for commands", style=STYLE_DIM)
+    text.append(" | ", style=STYLE_DIM)
+    text.append(f"v{version}", style=STYLE_DIM)
     return text
 
 
-def _handle_key(key: str, ui_state: UIState, backend: BackendService) -> None:
+def _handle_key(
+    key: str, ui_state: UIState, backend: BackendService, snapshot: BackendState
+) -> None:
     if key == "ctrl+p":
         if ui_state.palette_open:
             ui_state.palette_open = False
         else:
             ui_state.palette_open = True
-            ui_state.palette_options = _build_palette_options(ui_state, backend.snapshot())
+            ui_state.palette_options = _build_palette_options(ui_state, snapshot)
             ui_state.palette_index = 0
         return
     if ui_state.palette_open:
-        _handle_palette_key(key, ui_state, backend)
+        _handle_palette_key(key, ui_state, backend, snapshot)
         return
 
     if ui_state.view == "menu":
-        _handle_menu_key(key, ui_state, backend)
+        _handle_menu_key(key, ui_state, backend, snapshot)
         return
     if ui_state.view == "gateway":
         if key in {"q", "esc"}:
@@ -868,13 +1140,15 @@ def _update_web_browser_gateway(ui_state: UIState, gateway_id: str) -> None:
         ui_state.web_browser.gateway_node_id = gateway_id
 
 
-def _handle_menu_key(key: str, ui_state: UIState, backend: BackendService) -> None:
+def _handle_menu_key(
+    key: str, ui_state: UIState, backend: BackendService, snapshot: BackendState
+) -> None:
     if key == "up":
         ui_state.menu_index = (ui_state.menu_index - 1) % len(MENU_OPTIONS)
     elif key == "down":
         ui_state.menu_index = (ui_state.menu_index + 1) % len(MENU_OPTIONS)
     elif key == "enter":
-        if not backend.snapshot().radio_detected:
+        if not snapshot.radio_detected:
             return
         selection = MENU_OPTIONS[ui_state.menu_index]
         if selection == "Start Gateway":
@@ -930,12 +1204,59 @@ def _handle_client_key(key: str, ui_state: UIState, backend: BackendService) ->
             ui_state.client_url += key
 
 
+# DEC private mode 2026 (synchronized output): the terminal holds the frame until
+# the end marker and then paints it at once. Terminals without support ignore it.
+_SYNC_OUTPUT_BEGIN = "\x1b[?2026h"
+_SYNC_OUTPUT_END = "\x1b[?2026l"
+
+
+def _present(live: Live, console: Console, renderable: RenderableType) -> None:
+    """Repaint the Live display with renderable as one synchronized frame."""
+    if not console.is_terminal or console.legacy_windows:
+        live.update(renderable, refresh=True)
+        return
+    console.file.write(_SYNC_OUTPUT_BEGIN)
+    try:
+        live.update(renderable, refresh=True)
+    finally:
+        console.file.write(_SYNC_OUTPUT_END)
+        console.file.flush()
+
+
+def _watch_resize() -> threading.Event | None:
+    """Return an event set on every terminal resize.
+
+    Returns None where SIGWINCH does not exist (Windows); callers then poll the
+    console size on the render heartbeat instead.
+    """
+    if not hasattr(signal, "SIGWINCH"):
+        return None
+    resized = threading.Event()
+    signal.signal(signal.SIGWINCH, lambda signum, frame: resized.set())
+    return resized
+
+
+def _pin_console_size(console: Console, terminal: Console) -> ConsoleDimensions:
+    """Measure the terminal once and pin ``console`` to that size.
+
+    A pinned console answers ``size`` from memory, so rendering and ``Live``
+    refreshes stop querying the tty (an ioctl) on every frame. ``terminal`` is an
+    unpinned console used only to take the measurement.
+    """
+    size = terminal.size
+    # Console.size subtracts the legacy Windows margin from pinned widths again.
+    console.size = (size.width + console.legacy_windows, size.height)
+    return console.size
+
+
 def main() -> None:
     """Main entry point."""
     console = Console()
+    terminal = Console()
     backend = BackendService()
     ui_state = UIState()
     key_reader = KeyReader()
+    resized: threading.Event | None = None
     global BRIDGE_VERSION
     BRIDGE_VERSION = _load_version()
     ui_state.modes = _load_modes()
@@ -945,22 +1266,61 @@ def main() -> None:
         console.show_cursor(False)
         backend.start()
         key_reader.start()
+        resized = _watch_resize()
         
-        layout = render_ui(console, backend.snapshot(), ui_state)
+        snapshot = backend.snapshot()
+        rendered_size = _pin_console_size(console, terminal)
+        # The layout skeleton never changes; each render only swaps pane contents.
+        layout = render_ui(console, snapshot, ui_state, create_ui_layout(), rendered_size.width)
+        # Only rebuild the layout when something it shows may have changed: a key was
+        # handled, the backend published a new state, the terminal was resized, or the
+        # heartbeat elapsed (notice expiry and other time-based text).
+        rendered_snapshot = snapshot
+        rendered_at = time.monotonic()
         
-        with Live(layout, console=console, screen=True, refresh_per_second=10) as live:
+        # The loop below decides when a frame is due, so Live's own refresh thread
+        # would only repaint unchanged frames.
+        with Live(layout, console=console, screen=True, auto_refresh=False) as live:
             while True:
-                key = key_reader.get_key()
-                if key:
-                    _handle_key(key, ui_state, backend)
-                time.sleep(0.05)
-                live.update(render_ui(console, backend.snapshot(), ui_state))
+                # Sleep until a key arrives or it is time to check the backend again.
+                key = key_reader.get_key_blocking(FRAME_INTERVAL_SECONDS)
+                snapshot = backend.snapshot()
+                dirty = key is not None
+                if key is not None:
+                    # Apply every pending key against this frame's snapshot, then render
+                    # once for the whole batch.
+                    for pending in (key, *key_reader.get_keys()):
+                        _handle_key(pending, ui_state, backend, snapshot)
+                    # Actions such as starting the gateway publish a new state; show it.
+                    snapshot = backend.snapshot()
+                now = time.monotonic()
+                heartbeat = now - rendered_at >= RENDER_HEARTBEAT_SECONDS
+                # Re-measure the terminal only after SIGWINCH (or on the heartbeat
+                # where there is no such signal); otherwise the console stays pinned.
+                if resized is None:
+                    size_due = heartbeat
+                else:
+                    size_due = resized.is_set()
+                    resized.clear()
+                size = _pin_console_size(console, terminal) if size_due else rendered_size
+                if (
+                    dirty
+                    or snapshot is not rendered_snapshot
+                    or size != rendered_size
+                    or heartbeat
+                ):
+                    _present(live, console, render_ui(console, snapshot, ui_state, layout, size.width))
+                    rendered_snapshot = snapshot
+                    rendered_size = size
+                    rendered_at = now
                 
     except KeyboardInterrupt:
         pass
     finally:
         _stop_web_browser(ui_state)  # Clean up web browser
         key_reader.stop()
+        if resized is not None:
+            signal.signal(signal.SIGWINCH, signal.SIG_DFL)
         backend.stop()
         console.show_cursor(True)
         console.clear()
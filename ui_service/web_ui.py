@@ -8,25 +8,22 @@ the mesh network.
 from __future__ import annotations
 
 import base64
+import gzip
+import hashlib
 import html
 import logging
 import re
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from pathlib import Path
 from urllib.parse import urlparse
 
-from flask import Flask, request, render_template_string, jsonify
+from flask import Flask, Response, request, jsonify
 
-import sys
+from src_path import ensure_src_on_path
 
-ROOT = Path(__file__).resolve()
-while ROOT != ROOT.parent and not (ROOT / "src").exists():
-    ROOT = ROOT.parent
-SRC = ROOT / "src"
-if SRC.exists() and str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+ensure_src_on_path()
 
 from client import MeshtasticClient
 from radio import build_radio
@@ -668,6 +665,15 @@ class BrowseRequest:
     duration: float = 0.0
 
 
+@dataclass(frozen=True)
+class _IndexPage:
+    """Browser page rendered for one gateway ID, with its validator."""
+    gateway_id: str
+    html: str
+    etag: str
+    gzipped: bytes
+
+
 class MeshWebBrowser:
     """Web browser that fetches pages over Meshtastic mesh network."""
     
@@ -690,11 +696,17 @@ class MeshWebBrowser:
         
         # Track in-flight requests
         self._requests: dict[str, BrowseRequest] = {}
+        # IDs of done/error requests in the order they finished, for eviction.
+        self._finished_requests: deque[str] = deque()
         self._request_lock = threading.Lock()
         self._request_counter = 0
         
         # Flask app
         self.app = Flask(__name__)
+        # Compile the page once; the rendered HTML only changes with the gateway ID,
+        # which the terminal UI may update while the server runs.
+        self._index_template = self.app.jinja_env.from_string(BROWSER_HTML)
+        self._index_page: _IndexPage | None = None
         self._setup_routes()
     
     def _setup_routes(self) -> None:
@@ -702,7 +714,19 @@ class MeshWebBrowser:
         
         @self.app.route('/')
         def index():
-            return render_template_string(BROWSER_HTML, gateway_id=self.gateway_node_id)
+            page = self._render_index()
+            if request.accept_encodings["gzip"]:
+                response = Response(page.gzipped, mimetype="text/html")
+                response.headers["Content-Encoding"] = "gzip"
+                # Each encoding is its own representation, so it gets its own validator.
+                response.set_etag(page.etag + "-gzip")
+            else:
+                response = Response(page.html, mimetype="text/html")
+                response.set_etag(page.etag)
+            response.vary.add("Accept-Encoding")
+            response.headers["Cache-Control"] = "public, max-age=0, must-revalidate"
+            # Answers a matching If-None-Match with an empty 304.
+            return response.make_conditional(request)
         
         @self.app.route('/api/health')
         def health():
@@ -736,20 +760,7 @@ class MeshWebBrowser:
             with self._request_lock:
                 # Clean up old completed requests to prevent memory leak
                 if len(self._requests) > MAX_REQUESTS:
-                    # Find all completed/error requests
-                    completed = [
-                        (req_id, req) for req_id, req in self._requests.items()
-                        if req.status in ("done", "error")
-                    ]
-                    
-                    if completed:
-                        # Sort by start_time (oldest first) and remove half of them
-                        # to reduce memory while avoiding too-frequent cleanups
-                        completed.sort(key=lambda x: x[1].start_time)
-                        num_to_remove = max(1, len(completed) // 2)
-                        for req_id, _ in completed[:num_to_remove]:
-                            del self._requests[req_id]
-                    else:
+                    if not self._evict_finished_requests():
                         # No completed requests to clean up, but we're over limit.
                         # This could happen if all requests are pending/sending.
                         # Log a warning but allow the new request to proceed.
@@ -809,6 +820,24 @@ class MeshWebBrowser:
                 
                 return jsonify(result)
     
+    def _render_index(self) -> _IndexPage:
+        """Return the browser page for the current gateway ID, rendering on change."""
+        gateway_id = self.gateway_node_id
+        page = self._index_page
+        if page is not None and page.gateway_id == gateway_id:
+            return page
+        rendered = self._index_template.render(gateway_id=gateway_id)
+        encoded = rendered.encode("utf-8")
+        page = _IndexPage(
+            gateway_id=gateway_id,
+            html=rendered,
+            etag=hashlib.sha1(encoded, usedforsecurity=False).hexdigest(),
+            # Compressed once per gateway ID rather than per request.
+            gzipped=gzip.compress(encoded, compresslevel=9),
+        )
+        self._index_page = page
+        return page
+
     def _ensure_client(self) -> MeshtasticClient:
         """Ensure we have a working client connection."""
         if not self._is_gateway_id_valid():
@@ -833,6 +862,26 @@ class MeshWebBrowser:
             self._client = MeshtasticClient(self._transport, self.gateway_node_id)
             return self._client
     
+    def _finish_request(self, req: BrowseRequest, status: str) -> None:
+        """Mark a request done or errored. The caller must hold ``_request_lock``."""
+        req.status = status
+        self._finished_requests.append(req.request_id)
+
+    def _evict_finished_requests(self) -> int:
+        """Drop the oldest finished requests until the table is down to half capacity.
+
+        Finished request IDs are queued as they complete, so eviction pops from the
+        front of that queue instead of scanning the table. Trimming to half also
+        keeps cleanups infrequent. The caller must hold ``_request_lock``. Returns
+        the number removed.
+        """
+        excess = len(self._requests) - MAX_REQUESTS // 2
+        removed = 0
+        while removed < excess and self._finished_requests:
+            if self._requests.pop(self._finished_requests.popleft(), None) is not None:
+                removed += 1
+        return removed
+
     def _fetch_url(self, request_id: str) -> None:
         """Fetch a URL over the mesh network."""
         with self._request_lock:
@@ -881,7 +930,7 @@ class MeshWebBrowser:
                 req.duration = duration
                 
                 if response.type == "error":
-                    req.status = "error"
+                    self._finish_request(req, "error")
                     if isinstance(response.data, dict):
                         req.error = response.data.get("error", "Gateway returned error")
                     else:
@@ -908,20 +957,20 @@ class MeshWebBrowser:
                 if req.content:
                     req.content_html = self._rewrite_html(req.content, req.url)
                 
-                req.status = "done"
+                self._finish_request(req, "done")
                 
         except TimeoutError as e:
             with self._request_lock:
                 req = self._requests.get(request_id)
                 if req:
-                    req.status = "error"
+                    self._finish_request(req, "error")
                     req.error = f"Request timed out: {e}"
                     req.duration = time.time() - start_time
         except ValueError as e:
             with self._request_lock:
                 req = self._requests.get(request_id)
                 if req:
-                    req.status = "error"
+                    self._finish_request(req, "error")
                     req.error = str(e)
                     req.duration = time.time() - start_time
         except Exception as e:
@@ -929,7 +978,7 @@ class MeshWebBrowser:
             with self._request_lock:
                 req = self._requests.get(request_id)
                 if req:
-                    req.status = "error"
+                    self._finish_request(req, "error")
                     req.error = str(e)
                     req.duration = time.time() - start_time
     